@@ -4,6 +4,7 @@ Live demo of AgentForge — runs a full multi-agent workflow
 with a mock LLM (no API key needed).
 """
 import asyncio
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, patch
 
 from agentforge.core.forge import Forge
@@ -56,36 +57,63 @@ MOCK_RESPONSES = {
     ),
 }
 
-call_count = {"n": 0}
 agent_order = ["researcher", "writer"]
 
 
-async def mock_complete(**kwargs):
-    """Fake LLM that returns pre-written responses."""
-    current_model = kwargs.get("model", "openai/gpt-4o-mini")
-    idx = min(call_count["n"], len(agent_order) - 1)
-    agent = agent_order[idx]
-    call_count["n"] += 1
+def _clamped_iter(items):
+    """Yield each item once, then repeat the last one forever."""
+    yield from items
+    while True:
+        yield items[-1]
+
+
+_agent_iter = _clamped_iter(agent_order)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeUsage:
+    prompt_tokens: int = 350
+    completion_tokens: int = 420
+    total_tokens: int = 770
+
+
+@dataclass(frozen=True, slots=True)
+class FakeMessage:
+    content: str
+    tool_calls: None = None
+
 
-    # Simulate a realistic response structure
-    class FakeChoice:
-        class FakeMessage:
-            content = MOCK_RESPONSES[agent]
-            tool_calls = None
-        message = FakeMessage()
+@dataclass(frozen=True, slots=True)
+class FakeChoice:
+    message: FakeMessage
 
-    class FakeUsage:
-        prompt_tokens = 350
-        completion_tokens = 420
-        total_tokens = 770
 
-    class FakeResponse:
-        choices = [FakeChoice()]
-        usage = FakeUsage()
-        model = current_model
-        _hidden_params = {"response_cost": 0.0012}
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    choices: tuple[FakeChoice, ...]
+    usage: FakeUsage = FakeUsage()
+    model: str = ""
+    _hidden_params: dict = field(default_factory=lambda: {"response_cost": 0.0012})
 
-    return FakeResponse()
+
+_RESPONSE_CACHE: dict[tuple[str, str], FakeResponse] = {}
+
+
+def _build_response(agent: str, model: str) -> FakeResponse:
+    """Simulate a realistic litellm response structure."""
+    return FakeResponse(choices=(FakeChoice(FakeMessage(MOCK_RESPONSES[agent])),), model=model)
+
+
+async def mock_complete(**kwargs):
+    """Fake LLM that returns pre-written responses."""
+    current_model = kwargs.get("model", "openai/gpt-4o-mini")
+    agent = next(_agent_iter)
+
+    key = (agent, current_model)
+    response = _RESPONSE_CACHE.get(key)
+    if response is None:
+        response = _RESPONSE_CACHE[key] = _build_response(agent, current_model)
+    return response
 
 
 def main():
@@ -100,17 +128,21 @@ def main():
     # Subscribe to events so we can see real-time progress
     from agentforge.observe.tracer import TraceEvent, EventType
     from rich.console import Console
+    from rich.text import Text
     console = Console()
 
+    # Pre-parsed once; per-event pieces are appended without markup parsing
+    step_start_prefix = Text.from_markup("  [bold]▸[/bold] Running step ")
+    step_done_prefix = Text.from_markup("    [green]✓[/green] Done ")
+
     def on_event(event: TraceEvent):
         if event.event_type == EventType.STEP_START:
-            console.print(
-                f"  [bold]▸[/bold] Running step [cyan]{event.step_id}[/cyan] "
-                f"[dim]({event.agent_name})[/dim]..."
-            )
+            console.print(Text.assemble(
+                step_start_prefix, (event.step_id, "cyan"), " ", (f"({event.agent_name})", "dim"), "...",
+            ))
         elif event.event_type == EventType.STEP_END:
             ms = event.duration_ms or 0
-            console.print(f"    [green]✓[/green] Done ({ms/1000:.1f}s)")
+            console.print(Text.assemble(step_done_prefix, f"({ms/1000:.1f}s)"))
         elif event.event_type == EventType.WORKFLOW_START:
             team = event.data.get("team", "")
             agents = event.data.get("agents", [])
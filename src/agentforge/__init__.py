@@ -1,14 +1,36 @@
 """AgentForge — multi-agent orchestration framework."""
 
-from agentforge.core.forge import Forge
-from agentforge.core.agent import Agent
-from agentforge.core.team import Team
-from agentforge.core.workflow import Workflow
-from agentforge.core.step import Step
-from agentforge.core.result import ForgeResult, AgentResult, StepResult
-from agentforge.tools.base import Tool, tool
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from agentforge._version import __version__
 
+if TYPE_CHECKING:
+    from agentforge.core.forge import Forge
+    from agentforge.core.agent import Agent
+    from agentforge.core.team import Team
+    from agentforge.core.workflow import Workflow
+    from agentforge.core.step import Step
+    from agentforge.core.result import ForgeResult, AgentResult, StepResult
+    from agentforge.tools.base import Tool, tool
+
+# Public names resolved on first access (PEP 562) so that importing the
+# package — e.g. for `agentforge version` — does not pull in litellm/pydantic.
+_LAZY = {
+    "Forge": "agentforge.core.forge",
+    "Agent": "agentforge.core.agent",
+    "Team": "agentforge.core.team",
+    "Workflow": "agentforge.core.workflow",
+    "Step": "agentforge.core.step",
+    "ForgeResult": "agentforge.core.result",
+    "AgentResult": "agentforge.core.result",
+    "StepResult": "agentforge.core.result",
+    "Tool": "agentforge.tools.base",
+    "tool": "agentforge.tools.base",
+}
+
 __all__ = [
     "Forge",
     "Agent",
@@ -22,3 +44,16 @@ __all__ = [
     "tool",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module 'agentforge' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
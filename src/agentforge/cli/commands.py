@@ -2,38 +2,118 @@
 
 from __future__ import annotations
 
+import itertools
 import shutil
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
-import typer
+import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.text import Text
 
 from agentforge._version import __version__
 
-app = typer.Typer(
-    name="agentforge",
-    help="AgentForge — multi-agent orchestration framework.",
-    no_args_is_help=True,
-)
+
+@click.group(name="agentforge", no_args_is_help=True)
+def app():
+    """AgentForge — multi-agent orchestration framework."""
+
+
 console = Console()
 
 
+class _EventBatcher:
+    """Coalesce progress lines into one ``console.print`` per batch.
+
+    Lines are flushed once ``max_lines`` are queued, when ``max_delay`` seconds
+    have passed since the last flush, or explicitly via ``flush()``.
+    """
+
+    def __init__(self, target: Console, max_lines: int = 8, max_delay: float = 0.05):
+        self.target = target
+        self.max_lines = max_lines
+        self.max_delay = max_delay
+        self._pending: deque[str | Text] = deque()
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._last_flush = time.monotonic()
+
+    def add(self, line: str | Text):
+        with self._lock:
+            self._pending.append(line)
+            due = (
+                len(self._pending) >= self.max_lines
+                or time.monotonic() - self._last_flush >= self.max_delay
+            )
+            if not due and self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if due:
+            self.flush()
+
+    def flush(self):
+        from rich.console import Group
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            lines = list(self._pending)
+            self._pending.clear()
+            self.target.print(Group(*(Text.from_markup(line) if isinstance(line, str) else line for line in lines)))
+
+
+# Static files written by `init`, kept as bytes
+_INIT_RUN_PY = (
+    b'from agentforge import Forge\n'
+    b'\n'
+    b'forge = Forge.from_yaml("agents.yaml")\n'
+    b'result = forge.run(task=input("Enter your task: "))\n'
+    b'print(result.output)\n'
+)
+
+_INIT_ENV_EXAMPLE = (
+    b"# AgentForge Environment Variables\n"
+    b"# Uncomment and set the API keys for the providers you use.\n"
+    b"\n"
+    b"# OPENAI_API_KEY=sk-...\n"
+    b"# ANTHROPIC_API_KEY=sk-ant-...\n"
+    b"# GROQ_API_KEY=gsk_...\n"
+    b"# GOOGLE_API_KEY=...\n"
+    b"\n"
+    b"# For free local models, install Ollama: https://ollama.ai\n"
+    b"# Then use llm: ollama/llama3.2 in agents.yaml\n"
+)
+
+_INIT_GITIGNORE = b".agentforge/\n.env\n__pycache__/\n*.pyc\n"
+
+# Final outputs longer than this are printed raw instead of inside a Panel
+_PANEL_OUTPUT_LIMIT = 4096
+
+
 @app.command()
-def init(
-    name: str = typer.Argument(..., help="Project name"),
-    template: str = typer.Option(
-        "hello_world",
-        help="Template: hello_world, research_writer, code_reviewer, customer_support",
-    ),
-):
+@click.argument("name")
+@click.option(
+    "--template",
+    default="hello_world",
+    show_default=True,
+    help="Template: hello_world, research_writer, code_reviewer, customer_support",
+)
+def init(name: str, template: str):
     """Create a new AgentForge project."""
+    from rich.panel import Panel
+
     project_dir = Path(name)
 
     if project_dir.exists():
         console.print(f"[red]Error:[/red] Directory '{name}' already exists.")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
 
     project_dir.mkdir(parents=True)
 
@@ -41,8 +121,10 @@ def init(
     templates_dir = Path(__file__).parent.parent / "templates"
     template_file = templates_dir / f"{template}.yaml"
 
+    files: list[tuple[str, bytes]] = []
     if template_file.exists():
-        shutil.copy(template_file, project_dir / "agents.yaml")
+        with template_file.open("rb") as src, (project_dir / "agents.yaml").open("wb") as dst:
+            shutil.copyfileobj(src, dst, 64 * 1024)
     else:
         # Create a minimal default
         default_yaml = (
@@ -61,36 +143,15 @@ def init(
             '      agent: assistant\n'
             '      task: "{{input}}"\n'
         )
-        (project_dir / "agents.yaml").write_text(default_yaml)
-
-    # Create run.py
-    run_py = (
-        'from agentforge import Forge\n'
-        '\n'
-        'forge = Forge.from_yaml("agents.yaml")\n'
-        'result = forge.run(task=input("Enter your task: "))\n'
-        'print(result.output)\n'
-    )
-    (project_dir / "run.py").write_text(run_py)
-
-    # Create .env.example
-    env_example = (
-        "# AgentForge Environment Variables\n"
-        "# Uncomment and set the API keys for the providers you use.\n"
-        "\n"
-        "# OPENAI_API_KEY=sk-...\n"
-        "# ANTHROPIC_API_KEY=sk-ant-...\n"
-        "# GROQ_API_KEY=gsk_...\n"
-        "# GOOGLE_API_KEY=...\n"
-        "\n"
-        "# For free local models, install Ollama: https://ollama.ai\n"
-        "# Then use llm: ollama/llama3.2 in agents.yaml\n"
-    )
-    (project_dir / ".env.example").write_text(env_example)
+        files.append(("agents.yaml", default_yaml.encode()))
 
-    # Create .gitignore
-    gitignore = ".agentforge/\n.env\n__pycache__/\n*.pyc\n"
-    (project_dir / ".gitignore").write_text(gitignore)
+    files += [
+        ("run.py", _INIT_RUN_PY),
+        (".env.example", _INIT_ENV_EXAMPLE),
+        (".gitignore", _INIT_GITIGNORE),
+    ]
+    for filename, data in files:
+        (project_dir / filename).write_bytes(data)
 
     console.print(
         Panel(
@@ -106,14 +167,16 @@ def init(
 
 
 @app.command()
-def run(
-    yaml_path: str = typer.Option("agents.yaml", "--yaml", "-y", help="Path to agents.yaml"),
-    input_text: str = typer.Option(None, "--input", "-i", help="Task input"),
-    dry_run: bool = typer.Option(False, "--dry-run", "-d", help="Preview mode — no real actions"),
-    dashboard: bool = typer.Option(False, "--dashboard", help="Start live dashboard"),
-    port: int = typer.Option(8420, "--port", "-p", help="Dashboard port"),
-):
+@click.option("--yaml", "-y", "yaml_path", default="agents.yaml", show_default=True, help="Path to agents.yaml")
+@click.option("--input", "-i", "input_text", default=None, help="Task input")
+@click.option("--dry-run", "-d", is_flag=True, help="Preview mode — no real actions")
+@click.option("--dashboard", is_flag=True, help="Start live dashboard")
+@click.option("--port", "-p", default=8420, show_default=True, help="Dashboard port")
+def run(yaml_path: str, input_text: str | None, dry_run: bool, dashboard: bool, port: int):
     """Run the workflow defined in agents.yaml."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     from agentforge.core.forge import Forge
     from agentforge.config.loader import ConfigError
     from agentforge.observe.tracer import TraceEvent, EventType
@@ -123,10 +186,10 @@ def run(
         forge = Forge.from_yaml(yaml_path)
     except ConfigError as e:
         console.print(f"[red]Configuration Error:[/red] {e}")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
 
     # Get input
     if input_text is None:
@@ -135,14 +198,12 @@ def run(
         input_text = Prompt.ask("[bold cyan]Enter your task[/bold cyan]")
 
     # Print header
-    team_config = forge.config.get("team", {})
-    agents_list = list(forge.config.get("agents", {}).keys())
-    steps_count = len(forge.config.get("workflow", {}).get("steps", []))
+    steps_count = forge.step_count
 
     console.print(f"\n[bold]⚡ AgentForge[/bold] v{__version__}")
     console.print(
-        f"[dim]Team:[/dim] {team_config.get('name', 'Unknown')} "
-        f"[dim]|[/dim] [dim]Agents:[/dim] {len(agents_list)} "
+        f"[dim]Team:[/dim] {forge.team_name} "
+        f"[dim]|[/dim] [dim]Agents:[/dim] {len(forge.agent_names)} "
         f"[dim]|[/dim] [dim]Steps:[/dim] {steps_count}"
     )
 
@@ -154,35 +215,43 @@ def run(
     console.print()
 
     # Set up CLI event subscriber for real-time output
-    step_counter = {"current": 0}
+    step_counter = itertools.count(1)
+    batcher = _EventBatcher(console)
 
+    # Lines are assembled from (text, style) pieces so rich never parses markup
+    # on the hot path, and event values containing "[" are printed verbatim.
     def on_event(event: TraceEvent):
         if event.event_type == EventType.STEP_START:
-            step_counter["current"] += 1
+            step_number = next(step_counter)
             model = event.data.get("model", forge.llm_router.default_model)
-            console.print(
-                f"  [bold]▸[/bold] Step {step_counter['current']}/{steps_count}: "
-                f"[cyan]{event.step_id}[/cyan] "
-                f"[dim][{event.agent_name} → {model}][/dim]..."
-            )
+            batcher.add(Text.assemble(
+                "  ", ("▸", "bold"), f" Step {step_number}/{steps_count}: ",
+                (event.step_id, "cyan"), " ", (f"[{event.agent_name} → {model}]", "dim"), "...",
+            ))
         elif event.event_type == EventType.STEP_END:
             duration = event.duration_ms / 1000 if event.duration_ms else 0
-            tokens = (event.tokens.get("input", 0) + event.tokens.get("output", 0))
-            cost = event.cost or 0
-            status = "[green]✓[/green]" if event.data.get("success") else "[red]✗[/red]"
-            console.print(
-                f"    {status} Done ({duration:.1f}s, {tokens:,} tokens, ${cost:.4f})"
-            )
+            status = ("✓", "green") if event.data.get("success") else ("✗", "red")
+            batcher.add(Text.assemble(
+                "    ", status,
+                f" Done ({duration:.1f}s, {event.tokens_total:,} tokens, {event.cost_display})",
+            ))
         elif event.event_type == EventType.TOOL_CALL:
             tool_name = event.data.get("tool", "unknown")
             if event.data.get("dry_run"):
-                console.print(f"    [dim]🔧 [DRY RUN] {tool_name}[/dim]")
+                batcher.add(Text(f"    🔧 [DRY RUN] {tool_name}", style="dim"))
             else:
-                console.print(f"    [dim]🔧 {tool_name}[/dim]")
+                batcher.add(Text(f"    🔧 {tool_name}", style="dim"))
+        elif event.event_type == EventType.CACHE_HIT:
+            tokens_saved = event.data.get("tokens_saved", 0)
+            batcher.add(Text(f"    ♻️  Cached response ({tokens_saved:,} tokens saved)", style="dim"))
         elif event.event_type == EventType.ERROR:
-            console.print(f"    [red]❌ Error: {event.data.get('error', 'Unknown')}[/red]")
+            batcher.add(Text(f"    ❌ Error: {event.data.get('error', 'Unknown')}", style="red"))
+            batcher.flush()
         elif event.event_type == EventType.APPROVAL_REQUESTED:
-            console.print(f"    [yellow]🔔 Approval required for step {event.step_id}[/yellow]")
+            batcher.add(Text(f"    🔔 Approval required for step {event.step_id}", style="yellow"))
+            batcher.flush()
+        elif event.event_type == EventType.WORKFLOW_END:
+            batcher.flush()
 
     forge.event_bus.subscribe_sync(on_event)
 
@@ -190,20 +259,27 @@ def run(
     try:
         result = forge.run(input_text, dry_run=dry_run, dashboard=dashboard, port=port)
     except Exception as e:
+        batcher.flush()
         console.print(f"\n[red]Execution Error:[/red] {e}")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
+    batcher.flush()
 
     # Print final output
     if result.output:
         console.print()
-        console.print(
-            Panel(
-                result.output,
-                title="[bold]Output[/bold]",
-                border_style="green" if result.success else "red",
-                expand=True,
+        if len(result.output) > _PANEL_OUTPUT_LIMIT:
+            # Long outputs skip the panel's measure/wrap/box pass and let the terminal wrap
+            console.rule("[bold]Output[/bold]", style="green" if result.success else "red")
+            console.print(result.output, markup=False, highlight=False, soft_wrap=True)
+        else:
+            console.print(
+                Panel(
+                    result.output,
+                    title="[bold]Output[/bold]",
+                    border_style="green" if result.success else "red",
+                    expand=True,
+                )
             )
-        )
 
     # Print cost summary
     if result.cost.total_cost > 0 or result.cost.total_tokens.total > 0:
@@ -237,21 +313,22 @@ def run(
 
     if not result.success:
         console.print(f"\n[red]Workflow completed with errors: {result.error or 'See step details'}[/red]")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
 
 
 @app.command()
-def validate(
-    yaml_path: str = typer.Option("agents.yaml", "--yaml", "-y"),
-):
+@click.option("--yaml", "-y", "yaml_path", default="agents.yaml", show_default=True)
+def validate(yaml_path: str):
     """Validate agents.yaml without executing."""
     from agentforge.config.loader import ConfigError, ConfigLoader
 
+    # Always re-validate from disk rather than trusting a cached parse
+    ConfigLoader.clear_cache()
     try:
         config = ConfigLoader.load(yaml_path)
     except ConfigError as e:
         console.print(f"[red]❌ Validation failed:[/red]\n{e}")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
 
     team_config = config.get("team", {})
     agents_config = config.get("agents", {})
@@ -259,44 +336,40 @@ def validate(
 
     # Additional checks
     errors = []
-    agent_names = set(agents_config.keys())
-
-    # Check agent references in workflow steps
-    for step_item in workflow_config.get("steps", []):
-        if isinstance(step_item, dict):
-            if "parallel" in step_item:
-                for s in step_item["parallel"]:
-                    agent = s.get("agent", "")
-                    if agent and agent not in agent_names:
-                        errors.append(f"Agent '{agent}' referenced in parallel step but not defined")
+    steps = workflow_config.get("steps") or []
+
+    # Check agent references in workflow steps: one set difference over every reference
+    refs = [(agent, step_id) for agent, step_id in _step_agent_refs(steps) if agent]
+    missing = {agent for agent, _ in refs} - set(agents_config)
+    if missing:
+        for agent, step_id in refs:
+            if agent not in missing:
+                continue
+            if step_id is None:
+                errors.append(f"Agent '{agent}' referenced in parallel step but not defined")
             else:
-                agent = step_item.get("agent", "")
-                step_id = step_item.get("id", "?")
-                if agent and agent not in agent_names:
-                    errors.append(f"Agent '{agent}' referenced in step '{step_id}' but not defined")
-
-    # Check LLM format
-    team_llm = team_config.get("llm", "")
-    if team_llm and "/" not in team_llm:
-        errors.append(f"Team LLM '{team_llm}' should be in 'provider/model' format")
+                errors.append(f"Agent '{agent}' referenced in step '{step_id}' but not defined")
 
-    for name, agent_conf in agents_config.items():
-        agent_llm = agent_conf.get("llm")
-        if agent_llm and "/" not in agent_llm:
-            errors.append(f"Agent '{name}' LLM '{agent_llm}' should be in 'provider/model' format")
+    # Check LLM format for the team and every agent in one pass (owner None = team)
+    llm_specs = [(None, team_config.get("llm", ""))]
+    llm_specs.extend((n, c.get("llm")) for n, c in agents_config.items())
+    for owner, llm in llm_specs:
+        if llm and "/" not in llm:
+            label = "Team" if owner is None else f"Agent '{owner}'"
+            errors.append(f"{label} LLM '{llm}' should be in 'provider/model' format")
 
     if errors:
         console.print("[red]❌ Validation failed:[/red]")
         for err in errors:
             console.print(f"  - {err}")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
 
     # Success
     console.print("[green]✅ agents.yaml is valid![/green]")
     console.print(f"  Team: {team_config.get('name', 'Unknown')}")
     agent_list = ", ".join(f"{n} ({c.get('role', '?')})" for n, c in agents_config.items())
     console.print(f"  Agents: {agent_list}")
-    console.print(f"  Steps: {len(workflow_config.get('steps', []))}")
+    console.print(f"  Steps: {len(steps)}")
 
     # List tools
     all_tools = set()
@@ -307,10 +380,22 @@ def validate(
         console.print(f"  Tools: {', '.join(sorted(all_tools))}")
 
 
+def _step_agent_refs(steps: list):
+    """Yield ``(agent, step_id)`` for every step; ``step_id`` is None inside parallel blocks."""
+    for step_item in steps:
+        if not isinstance(step_item, dict):
+            continue
+        parallel = step_item.get("parallel")
+        if parallel is not None:
+            for s in parallel:
+                yield s.get("agent"), None
+        else:
+            yield step_item.get("agent"), step_item.get("id", "?")
+
+
 @app.command(name="dashboard")
-def dashboard_cmd(
-    port: int = typer.Option(8420, "--port", "-p"),
-):
+@click.option("--port", "-p", default=8420, show_default=True)
+def dashboard_cmd(port: int):
     """Start the dashboard server standalone."""
     import uvicorn
 
@@ -328,11 +413,12 @@ def dashboard_cmd(
 
 
 @app.command()
-def cost(
-    yaml_path: str = typer.Option("agents.yaml", "--yaml", "-y"),
-    input_text: str = typer.Option("ping", "--input", "-i", help="Dummy task for cost estimation"),
-):
+@click.option("--yaml", "-y", "yaml_path", default="agents.yaml", show_default=True)
+@click.option("--input", "-i", "input_text", default="ping", show_default=True, help="Dummy task for cost estimation")
+def cost(yaml_path: str, input_text: str):
     """Show cost estimate by performing a dry run."""
+    from rich.table import Table
+
     from agentforge.core.forge import Forge
     from agentforge.config.loader import ConfigError
 
@@ -340,7 +426,7 @@ def cost(
         forge = Forge.from_yaml(yaml_path)
     except ConfigError as e:
         console.print(f"[red]Configuration Error:[/red] {e}")
-        raise typer.Exit(code=1)
+        raise click.exceptions.Exit(1)
 
     result = forge.run(task=input_text, dry_run=True)
 
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import copy
-
 DEFAULTS = {
     "team": {
         "name": "AgentForge Team",
@@ -28,6 +26,14 @@ DEFAULTS = {
             "max_retries": 3,
             "timeout": 300,
             "confidence_threshold": 0.4,
+            "max_concurrency": None,
+        },
+        "cache": {
+            "enabled": True,
+            "backend": "memory",
+            "ttl": None,
+            "max_entries": 1024,
+            "similarity_threshold": None,
         },
     },
     "agent_defaults": {
@@ -45,6 +51,9 @@ DEFAULTS = {
         "control": {
             "require_approval": False,
             "max_iterations": 10,
+            "tool_concurrency": 8,
+            "context_window_messages": None,
+            "tool_output_max_chars": None,
             "allowed_actions": [],
             "blocked_actions": [],
         },
@@ -53,21 +62,31 @@ DEFAULTS = {
 
 
 def merge_with_defaults(config: dict) -> dict:
-    return _deep_merge(copy.deepcopy(DEFAULTS), config)
+    return _deep_merge(DEFAULTS, config)
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override into base. Returns a new dict."""
+    """Recursively merge override into base. Returns a new dict; neither input is mutated."""
     merged = {}
-    for key in set(base) | set(override):
-        if key in base and key in override:
-            bv, ov = base[key], override[key]
-            if isinstance(bv, dict) and isinstance(ov, dict):
-                merged[key] = _deep_merge(bv, ov)
-            else:
-                merged[key] = copy.deepcopy(ov)
-        elif key in override:
-            merged[key] = copy.deepcopy(override[key])
+    for key, bv in base.items():
+        if key not in override:
+            merged[key] = _copy_leaf(bv)
+            continue
+        ov = override[key]
+        if isinstance(bv, dict) and isinstance(ov, dict):
+            merged[key] = _deep_merge(bv, ov)
         else:
-            merged[key] = copy.deepcopy(base[key])
+            merged[key] = _copy_leaf(ov)
+    for key, ov in override.items():
+        if key not in base:
+            merged[key] = _copy_leaf(ov)
     return merged
+
+
+def _copy_leaf(value):
+    """Copy only the mutable containers; scalars are shared as-is."""
+    if isinstance(value, dict):
+        return _deep_merge(value, {})
+    if isinstance(value, list):
+        return [_copy_leaf(v) for v in value]
+    return value
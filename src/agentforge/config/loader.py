@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
 from typing import Union
 
 import yaml
 from pydantic import ValidationError
 
-from agentforge.config.defaults import merge_with_defaults
-from agentforge.config.schema import ForgeConfig
+from agentforge.config.defaults import DEFAULTS, merge_with_defaults
+from agentforge.config.schema import ForgeConfig, TeamConfig
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+# Validated once at import; sections the user leaves untouched reuse these
+# instances instead of re-running their validators on every load.
+_DEFAULT_TEAM = TeamConfig.model_validate(DEFAULTS["team"])
+_DEFAULT_TEAM_SECTIONS = {
+    "memory": _DEFAULT_TEAM.memory,
+    "observe": _DEFAULT_TEAM.observe,
+    "control": _DEFAULT_TEAM.control,
+    "cache": _DEFAULT_TEAM.cache,
+}
 
 
 class ConfigError(Exception):
@@ -29,6 +47,22 @@ class ConfigLoader:
                 f"Run 'agentforge init' to create one, or specify the path with --yaml."
             )
 
+        # Key on (path, mtime, size) so an edited file is re-parsed; stat only, no read on hit
+        try:
+            stat = path.stat()
+        except OSError as e:
+            raise ConfigError(f"Error reading '{path}': {e}")
+
+        config = _load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        # Hand out a private copy so callers can mutate freely
+        return copy.deepcopy(config)
+
+    @staticmethod
+    def clear_cache() -> None:
+        _load_cached.cache_clear()
+
+    @staticmethod
+    def _load_uncached(path: Path) -> dict:
         # Read file
         try:
             raw_text = path.read_text(encoding="utf-8")
@@ -39,7 +73,7 @@ class ConfigLoader:
 
         # Parse YAML
         try:
-            raw_config = yaml.safe_load(raw_text)
+            raw_config = yaml.load(raw_text, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             if hasattr(e, "problem_mark"):
                 mark = e.problem_mark
@@ -61,10 +95,11 @@ class ConfigLoader:
     def validate(config: dict) -> dict:
         # Merge with defaults
         merged = merge_with_defaults(config)
+        _reuse_default_sections(config, merged)
 
         # Validate with Pydantic
         try:
-            validated = ForgeConfig(**merged)
+            validated = ForgeConfig.model_validate(merged)
         except ValidationError as e:
             errors = []
             for err in e.errors():
@@ -76,3 +111,21 @@ class ConfigLoader:
 
         # Return validated model as dict (preserves Pydantic defaults/coercions)
         return validated.model_dump()
+
+
+def _reuse_default_sections(config: dict, merged: dict) -> None:
+    """Swap untouched default sections in ``merged`` for their pre-validated models."""
+    user_team = config.get("team")
+    if user_team is None:
+        merged["team"] = _DEFAULT_TEAM
+        return
+    if not isinstance(user_team, dict) or not isinstance(merged.get("team"), dict):
+        return
+    for key, section in _DEFAULT_TEAM_SECTIONS.items():
+        if key not in user_team:
+            merged["team"][key] = section
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(resolved_path: str, mtime_ns: int, size: int) -> dict:
+    return ConfigLoader._load_uncached(Path(resolved_path))
@@ -2,65 +2,58 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from pathlib import Path
+from typing import Annotated, Any, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, field_validator, model_validator
 
 
-class MemoryConfig(BaseModel):
+class _FrozenModel(BaseModel):
+    # Configs are read-only once loaded; unknown keys are reported, not dropped
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class MemoryConfig(_FrozenModel):
     enabled: bool = True
-    backend: str = "sqlite"
+    backend: Literal["sqlite", "chromadb", "memory"] = "sqlite"
     path: str = ".agentforge/memory.db"
     shared: bool = True
 
-    @field_validator("backend")
-    @classmethod
-    def validate_backend(cls, v: str) -> str:
-        allowed = ("sqlite", "chromadb", "memory")
-        if v not in allowed:
-            raise ValueError(f"memory.backend must be one of {allowed}, got '{v}'")
-        return v
-
 
-class ObserveConfig(BaseModel):
+class ObserveConfig(_FrozenModel):
     trace: bool = True
     cost_tracking: bool = True
-    log_level: str = "info"
-    log_format: str = "pretty"
-
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        allowed = ("debug", "info", "warning", "error")
-        if v not in allowed:
-            raise ValueError(f"log_level must be one of {allowed}, got '{v}'")
-        return v
-
-    @field_validator("log_format")
-    @classmethod
-    def validate_log_format(cls, v: str) -> str:
-        allowed = ("pretty", "json")
-        if v not in allowed:
-            raise ValueError(f"log_format must be one of {allowed}, got '{v}'")
-        return v
+    log_level: Literal["debug", "info", "warning", "error"] = "info"
+    log_format: Literal["pretty", "json"] = "pretty"
 
 
-class ControlConfig(BaseModel):
+class ControlConfig(_FrozenModel):
     dry_run: bool = False
     max_retries: int = 3
     timeout: int = 300
     confidence_threshold: float = 0.4
+    max_concurrency: Optional[int] = Field(default=None, ge=1)  # cap on concurrently running parallel steps
+
+
+class CacheConfig(_FrozenModel):
+    enabled: bool = True
+    backend: Literal["memory", "sqlite"] = "memory"
+    ttl: Optional[int] = None
+    max_entries: int = 1024
+    similarity_threshold: Optional[float] = Field(default=None, gt=0.0, le=1.0)  # None = exact match only
 
 
-class TeamConfig(BaseModel):
+class TeamConfig(_FrozenModel):
     name: str
     description: str = ""
     llm: str = "openai/gpt-4o-mini"
-    temperature: float = 0.7
+    fallback_models: list[str] = Field(default_factory=list)
+    temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: int = 4096
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     observe: ObserveConfig = Field(default_factory=ObserveConfig)
     control: ControlConfig = Field(default_factory=ControlConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
 
     @field_validator("llm")
     @classmethod
@@ -71,36 +64,25 @@ class TeamConfig(BaseModel):
             )
         return v
 
-    @field_validator("temperature")
-    @classmethod
-    def validate_temperature(cls, v: float) -> float:
-        if not 0.0 <= v <= 2.0:
-            raise ValueError(f"temperature must be between 0.0 and 2.0, got {v}")
-        return v
 
-
-class AgentMemoryConfig(BaseModel):
+class AgentMemoryConfig(_FrozenModel):
     enabled: bool = True
-    type: str = "short_term"
+    type: Literal["short_term", "long_term"] = "short_term"
     recall_limit: int = 10
 
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        allowed = ("short_term", "long_term")
-        if v not in allowed:
-            raise ValueError(f"memory.type must be one of {allowed}, got '{v}'")
-        return v
-
 
-class AgentControlConfig(BaseModel):
+class AgentControlConfig(_FrozenModel):
     require_approval: bool = False
     max_iterations: int = 10
+    confidence_threshold: float = 0.0
+    tool_concurrency: int = Field(default=8, ge=1)  # cap on concurrent tool calls per LLM turn
+    context_window_messages: Optional[int] = Field(default=None, ge=3)  # None = keep full history
+    tool_output_max_chars: Optional[int] = Field(default=None, ge=1)  # None = no truncation
     allowed_actions: list[str] = Field(default_factory=list)
     blocked_actions: list[str] = Field(default_factory=list)
 
 
-class AgentConfig(BaseModel):
+class AgentConfig(_FrozenModel):
     role: str
     goal: str
     backstory: str = ""
@@ -112,6 +94,7 @@ class AgentConfig(BaseModel):
     memory: AgentMemoryConfig = Field(default_factory=AgentMemoryConfig)
     control: AgentControlConfig = Field(default_factory=AgentControlConfig)
     instructions: str = ""
+    cache: Optional[bool] = None  # None = cache only temperature-0 calls
 
     @field_validator("llm")
     @classmethod
@@ -121,7 +104,7 @@ class AgentConfig(BaseModel):
         return v
 
 
-class StepConfig(BaseModel):
+class StepConfig(_FrozenModel):
     id: str
     agent: str
     task: str
@@ -137,56 +120,136 @@ class StepConfig(BaseModel):
     next: Optional[str] = None
 
 
-class ParallelStepConfig(BaseModel):
+class ParallelStepConfig(_FrozenModel):
     parallel: list[StepConfig]
 
 
-class WorkflowConfig(BaseModel):
-    steps: list[StepConfig | ParallelStepConfig]
+def _step_kind(value: Any) -> str | None:
+    # Route each step on its shape so pydantic validates one variant, not both
+    if isinstance(value, dict):
+        return "parallel" if "parallel" in value else "step"
+    if isinstance(value, ParallelStepConfig):
+        return "parallel"
+    if isinstance(value, StepConfig):
+        return "step"
+    return None
+
+
+WorkflowStep = Annotated[
+    Union[
+        Annotated[StepConfig, Tag("step")],
+        Annotated[ParallelStepConfig, Tag("parallel")],
+    ],
+    Discriminator(_step_kind),
+]
+
 
+class WorkflowConfig(_FrozenModel):
+    steps: list[WorkflowStep]
 
-class InlineToolParam(BaseModel):
+
+class InlineToolParam(_FrozenModel):
     type: str = "string"
     description: str = ""
     required: bool = False
 
 
-class InlineToolConfig(BaseModel):
+class InlineToolConfig(_FrozenModel):
     description: str
     parameters: dict[str, InlineToolParam] = Field(default_factory=dict)
     handler: str  # "module_path:function_name"
 
 
-class ForgeConfig(BaseModel):
+class ForgeConfig(_FrozenModel):
     team: TeamConfig
     agents: dict[str, AgentConfig]
     workflow: WorkflowConfig
     tools: dict[str, InlineToolConfig] = Field(default_factory=dict)
+    agent_defaults: dict[str, Any] = Field(default_factory=dict)  # merged in from DEFAULTS
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ForgeConfig":
+        """Load and validate a YAML config file.
+
+        Goes through ``ConfigLoader``, so the libyaml parser and the
+        (path, mtime, size) cache apply; the cached, already-validated dict is
+        rebuilt without running validators again.
+        """
+        from agentforge.config.loader import ConfigLoader
+
+        return cls.from_trusted_dict(ConfigLoader.load(path))
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "ForgeConfig":
+        """Rebuild a config from already-validated data (e.g. ``model_dump()`` output).
+
+        Skips every validator. ``model_construct`` does not recurse, so nested
+        models are constructed bottom-up here.
+        """
+        team = data["team"]
+        return cls.model_construct(
+            team=_construct(
+                TeamConfig, team,
+                memory=_construct(MemoryConfig, team.get("memory", {})),
+                observe=_construct(ObserveConfig, team.get("observe", {})),
+                control=_construct(ControlConfig, team.get("control", {})),
+                cache=_construct(CacheConfig, team.get("cache", {})),
+            ),
+            agents={
+                name: _construct(
+                    AgentConfig, agent,
+                    memory=_construct(AgentMemoryConfig, agent.get("memory", {})),
+                    control=_construct(AgentControlConfig, agent.get("control", {})),
+                )
+                for name, agent in data["agents"].items()
+            },
+            workflow=_construct(
+                WorkflowConfig, data["workflow"],
+                steps=[_construct_step(step) for step in data["workflow"]["steps"]],
+            ),
+            tools={
+                name: _construct(
+                    InlineToolConfig, tool,
+                    parameters={
+                        pname: _construct(InlineToolParam, param)
+                        for pname, param in tool.get("parameters", {}).items()
+                    },
+                )
+                for name, tool in data.get("tools", {}).items()
+            },
+            agent_defaults=data.get("agent_defaults", {}),
+        )
 
     @model_validator(mode="after")
     def validate_agent_references(self) -> "ForgeConfig":
-        agent_names = set(self.agents.keys())
+        # Steps are already coerced to models here, so no raw-dict fallback is needed
+        is_defined = frozenset(self.agents).__contains__
 
         for step_item in self.workflow.steps:
             if isinstance(step_item, ParallelStepConfig):
-                for s in step_item.parallel:
-                    if s.agent not in agent_names:
-                        raise ValueError(
-                            f"Parallel step '{s.id}' references agent '{s.agent}' "
-                            f"which is not defined. Available: {sorted(agent_names)}"
-                        )
-            elif isinstance(step_item, StepConfig):
-                if step_item.agent not in agent_names:
-                    raise ValueError(
-                        f"Step '{step_item.id}' references agent '{step_item.agent}' "
-                        f"which is not defined. Available: {sorted(agent_names)}"
-                    )
-            elif isinstance(step_item, dict):
-                # Fallback for raw dict input before Pydantic coercion
-                agent = step_item.get("agent", "")
-                if agent and agent not in agent_names:
+                label, steps = "Parallel step", step_item.parallel
+            else:
+                label, steps = "Step", (step_item,)
+            for s in steps:
+                if not is_defined(s.agent):
                     raise ValueError(
-                        f"Step references agent '{agent}' "
-                        f"which is not defined. Available: {sorted(agent_names)}"
+                        f"{label} '{s.id}' references agent '{s.agent}' "
+                        f"which is not defined. Available: {sorted(self.agents)}"
                     )
         return self
+
+
+def _construct(model: type[BaseModel], data: Any, **children: Any) -> Any:
+    if isinstance(data, model):
+        return data
+    return model.model_construct(**{**data, **children})
+
+
+def _construct_step(data: Any) -> StepConfig | ParallelStepConfig:
+    if isinstance(data, (StepConfig, ParallelStepConfig)):
+        return data
+    if "parallel" in data:
+        return ParallelStepConfig.model_construct(
+            parallel=[_construct(StepConfig, s) for s in data["parallel"]]
+        )
+    return StepConfig.model_construct(**data)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from dataclasses import dataclass
 
 from rich.console import Console
@@ -10,20 +11,37 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApprovalResult:
     approved: bool
     edited_output: str | None = None
     reason: str | None = None
 
 
+def _read_until_blank() -> str:
+    """Read stdin lines until an empty line or EOF, in one worker thread."""
+    lines = []
+    for line in iter(sys.stdin.readline, ""):
+        line = line.rstrip("\r\n")
+        if not line:
+            break
+        lines.append(line)
+    return "\n".join(lines)
+
+
 class ApprovalManager:
 
+    _PANEL_TEMPLATE = (
+        "[bold]Step:[/bold] {step_id}\n"
+        "[bold]Agent:[/bold] {agent_name}\n"
+        "[bold]Task:[/bold] {task}\n\n"
+        "[bold]Output:[/bold]\n{output}"
+    )
+
     def __init__(self, mode: str = "cli"):
         self.mode = mode
         self.console = Console()
-        self.pending_approvals: dict[str, asyncio.Event] = {}
-        self._approval_results: dict[str, ApprovalResult] = {}
+        self.pending_approvals: dict[str, asyncio.Future[ApprovalResult]] = {}
 
     async def request_approval(
         self,
@@ -44,10 +62,12 @@ class ApprovalManager:
         display_output = output[:500] + "..." if len(output) > 500 else output
 
         panel = Panel(
-            f"[bold]Step:[/bold] {step_id}\n"
-            f"[bold]Agent:[/bold] {agent_name}\n"
-            f"[bold]Task:[/bold] {task}\n\n"
-            f"[bold]Output:[/bold]\n{display_output}",
+            self._PANEL_TEMPLATE.format_map({
+                "step_id": step_id,
+                "agent_name": agent_name,
+                "task": task,
+                "output": display_output,
+            }),
             title="🔔 Approval Required",
             border_style="yellow",
         )
@@ -70,28 +90,22 @@ class ApprovalManager:
             return ApprovalResult(approved=False, reason=reason)
         else:  # edit
             self.console.print("[blue]✏️  Edit mode — enter new output (end with empty line):[/blue]")
-            lines = []
-            while True:
-                line = await asyncio.to_thread(input)
-                if line == "":
-                    break
-                lines.append(line)
-            edited = "\n".join(lines) if lines else output
+            edited = await asyncio.to_thread(_read_until_blank) or output
             self.console.print("[green]✅ Approved with edits[/green]")
             return ApprovalResult(approved=True, edited_output=edited)
 
     async def _request_dashboard_approval(
         self, step_id: str, agent_name: str, task: str, output: str
     ) -> ApprovalResult:
-        event = asyncio.Event()
-        self.pending_approvals[step_id] = event
+        future = asyncio.get_running_loop().create_future()
+        self.pending_approvals[step_id] = future
 
-        # Wait for the dashboard to send approval
-        await event.wait()
-
-        result = self._approval_results.pop(step_id, ApprovalResult(approved=True))
-        self.pending_approvals.pop(step_id, None)
-        return result
+        # Wait for the dashboard to send approval; cleaned up even if cancelled
+        try:
+            return await future
+        finally:
+            if self.pending_approvals.get(step_id) is future:
+                del self.pending_approvals[step_id]
 
     def resolve_approval(
         self,
@@ -100,11 +114,10 @@ class ApprovalManager:
         edited_output: str | None = None,
         reason: str | None = None,
     ):
-        self._approval_results[step_id] = ApprovalResult(
-            approved=approved,
-            edited_output=edited_output,
-            reason=reason,
-        )
-        event = self.pending_approvals.get(step_id)
-        if event:
-            event.set()
+        future = self.pending_approvals.get(step_id)
+        if future is not None and not future.done():
+            future.set_result(ApprovalResult(
+                approved=approved,
+                edited_output=edited_output,
+                reason=reason,
+            ))
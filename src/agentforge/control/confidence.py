@@ -2,6 +2,29 @@
 
 from __future__ import annotations
 
+_UNCERTAINTY_PHRASES = (
+    "i'm not sure",
+    "i am not sure",
+    "i don't know",
+    "i'm unsure",
+    "uncertain",
+    "not confident",
+    "possibly",
+    "maybe",
+    "might be",
+    "hard to say",
+    "difficult to determine",
+    "unclear",
+    "i think",
+    "it seems",
+    "perhaps",
+)
+_SHORTEST_PHRASE = min(map(len, _UNCERTAINTY_PHRASES))
+_SHORT_OUTPUT_WORDS = 20
+_LONG_OUTPUT_WORDS = 200
+# Fewer characters than this cannot hold 20 words (20 letters + 19 separators)
+_SHORT_OUTPUT_CHARS = 2 * _SHORT_OUTPUT_WORDS - 1
+
 
 class ConfidenceChecker:
 
@@ -10,39 +33,25 @@ class ConfidenceChecker:
 
     def check(self, output: str) -> float:
         """Estimate confidence from the output text using keyword heuristics."""
-        uncertainty_phrases = [
-            "i'm not sure",
-            "i am not sure",
-            "i don't know",
-            "i'm unsure",
-            "uncertain",
-            "not confident",
-            "possibly",
-            "maybe",
-            "might be",
-            "hard to say",
-            "difficult to determine",
-            "unclear",
-            "i think",
-            "it seems",
-            "perhaps",
-        ]
-
-        output_lower = output.lower()
-
         # Start with base confidence
         confidence = 0.7
 
-        # Check for uncertainty phrases
-        uncertainty_count = sum(1 for phrase in uncertainty_phrases if phrase in output_lower)
-        confidence -= uncertainty_count * 0.1
+        # Check for uncertainty phrases (none fit in shorter text)
+        if len(output) >= _SHORTEST_PHRASE:
+            output_lower = output.lower()
+            uncertainty_count = sum(1 for phrase in _UNCERTAINTY_PHRASES if phrase in output_lower)
+            confidence -= uncertainty_count * 0.1
 
-        # Boost for longer, detailed output
-        word_count = len(output.split())
-        if word_count > 200:
-            confidence += 0.1
-        elif word_count < 20:
+        # Boost for longer, detailed output. Only "more than 200" matters above
+        # the threshold, so stop splitting there instead of listing every word.
+        if len(output) < _SHORT_OUTPUT_CHARS:
             confidence -= 0.1
+        else:
+            word_count = len(output.split(maxsplit=_LONG_OUTPUT_WORDS))
+            if word_count > _LONG_OUTPUT_WORDS:
+                confidence += 0.1
+            elif word_count < _SHORT_OUTPUT_WORDS:
+                confidence -= 0.1
 
         # Clamp to [0, 1]
         confidence = max(0.0, min(1.0, confidence))
@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
+import reprlib
+
 from agentforge.tools.base import ToolResult
 
+_DRY_RUN_TEMPLATE = (
+    "[DRY RUN] Would call {name}({args})\n"
+    "Simulated result: Tool '{name}' executed successfully with provided arguments."
+)
+
+# Arguments are only echoed for information, so large values are abbreviated
+# rather than repr'd in full
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = 200
+_arg_repr.maxother = 200
+
 
 class DryRunController:
 
@@ -11,9 +24,6 @@ class DryRunController:
         self.enabled = enabled
 
     def simulate_tool(self, tool_name: str, arguments: dict) -> ToolResult:
-        args_str = ", ".join(f"{k}={v!r}" for k, v in arguments.items())
-        simulated_output = (
-            f"[DRY RUN] Would call {tool_name}({args_str})\n"
-            f"Simulated result: Tool '{tool_name}' executed successfully with provided arguments."
-        )
+        args_str = ", ".join(f"{k}={_arg_repr.repr(v)}" for k, v in arguments.items())
+        simulated_output = _DRY_RUN_TEMPLATE.format(name=tool_name, args=args_str)
         return ToolResult(success=True, output=simulated_output)
@@ -12,13 +12,19 @@ class Guardrails:
     ):
         self.allowed_actions = allowed_actions or []
         self.blocked_actions = blocked_actions or []
+        self._allowed = frozenset(self.allowed_actions)
+        self._blocked = frozenset(self.blocked_actions)
 
     def is_tool_allowed(self, tool_name: str) -> bool:
-        if self.blocked_actions and tool_name in self.blocked_actions:
+        if tool_name in self._blocked:
             return False
-        if self.allowed_actions and tool_name not in self.allowed_actions:
+        if self._allowed and tool_name not in self._allowed:
             return False
         return True
 
     def filter_tools(self, tool_names: list[str]) -> list[str]:
-        return [t for t in tool_names if self.is_tool_allowed(t)]
+        allowed, blocked = self._allowed, self._blocked
+        return [
+            t for t in tool_names
+            if t not in blocked and (not allowed or t in allowed)
+        ]
@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from typing import Any, Callable, Coroutine
 
 
 class RetryHandler:
 
-    def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        retry_on: tuple[type[BaseException], ...] = (asyncio.TimeoutError, ConnectionError, OSError),
+    ):
         self.max_retries = max(0, max_retries)
         self.base_delay = base_delay
+        # Only transient failures are retried; anything else (bugs) raises at once
+        self.retry_on = retry_on
+        self._delays = tuple(base_delay * (2**i) for i in range(self.max_retries))
 
     async def execute_with_retry(
         self,
@@ -18,15 +27,60 @@ class RetryHandler:
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        last_error: Exception | None = None
+        last_error: BaseException | None = None
 
         for attempt in range(self.max_retries + 1):
             try:
                 return await func(*args, **kwargs)
-            except Exception as e:
+            except self.retry_on as e:
                 last_error = e
                 if attempt < self.max_retries:
-                    delay = self.base_delay * (2**attempt)
-                    await asyncio.sleep(delay)
+                    # Jitter keeps parallel agents from retrying in lockstep
+                    await asyncio.sleep(self._delays[attempt] * random.uniform(0.5, 1.5))
 
         raise last_error  # type: ignore[misc]
+
+    async def execute_with_hedge(
+        self,
+        func: Callable[..., Coroutine],
+        *args: Any,
+        hedge_delay: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run ``func`` and start a second attempt if the first is still pending
+        after ``hedge_delay`` (default ``base_delay``); the first success wins.
+
+        Only for idempotent calls, since both attempts may run concurrently. If
+        both fail, falls back to ``execute_with_retry``.
+        """
+        delay = self.base_delay if hedge_delay is None else hedge_delay
+        pending = {asyncio.ensure_future(func(*args, **kwargs))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            winner = self._first_success(done)
+            if winner is not None:
+                return winner.result()
+
+            pending.add(asyncio.ensure_future(func(*args, **kwargs)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = self._first_success(done)
+                if winner is not None:
+                    return winner.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return await self.execute_with_retry(func, *args, **kwargs)
+
+    def _first_success(self, tasks: set[asyncio.Future]) -> asyncio.Future | None:
+        """Return a successful task, re-raising non-retryable failures."""
+        for task in tasks:
+            if task.cancelled():
+                continue
+            error = task.exception()
+            if error is None:
+                return task
+            if not isinstance(error, self.retry_on):
+                raise error
+        return None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import time
 from typing import Any
 
@@ -11,7 +11,38 @@ from agentforge.control.confidence import ConfidenceChecker
 from agentforge.control.dry_run import DryRunController
 from agentforge.control.guardrails import Guardrails
 from agentforge.llm.provider import LLMResponse
-from agentforge.observe.tracer import EventType, TraceEvent
+from agentforge.observe.tracer import EventType, TraceEvent, dumps_json
+from agentforge.tools.base import ToolResult
+
+
+_PROMPT_GUIDELINES = (
+    "\nGuidelines:\n"
+    "- Use tools when you need external information or actions.\n"
+    "- When you have enough information, respond directly without tool calls.\n"
+    "- Be precise and factual."
+)
+
+
+def _trim_history(messages: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    """Keep the system and task messages plus the newest turns, about `limit` in all."""
+    if len(messages) <= limit:
+        return messages
+    start = len(messages) - (limit - 2)
+    # Tool results stay with the assistant message that requested them
+    while start > 2 and messages[start]["role"] == "tool":
+        start -= 1
+    return messages[:2] + messages[start:]
+
+
+def _clip_tool_output(text: str, max_chars: int | None) -> str:
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "...[truncated]"
+
+
+def _encode_args(arguments: Any) -> Any:
+    # Parsed argument dicts go back to the LLM as a JSON string
+    return dumps_json(arguments) if isinstance(arguments, dict) else arguments
 
 
 class Agent:
@@ -31,6 +62,7 @@ class Agent:
         memory: Any = None,
         instructions: str = "",
         control: dict | None = None,
+        cache: bool | None = None,
     ):
         self.name = name
         self.role = role
@@ -44,10 +76,14 @@ class Agent:
         self.memory = memory
         self.instructions = instructions
         self.control = control or {}
+        self.cache = cache
         self.guardrails = Guardrails(
             allowed_actions=self.control.get("allowed_actions", []),
             blocked_actions=self.control.get("blocked_actions", []),
         )
+        self._prompt_cache: tuple[tuple, str] | None = None
+        self._tools_cache: tuple[tuple, list[dict], dict[str, Any], dict[str, bool]] | None = None
+        self._checker: ConfidenceChecker | None = None
 
     async def execute(
         self,
@@ -58,44 +94,37 @@ class Agent:
         event_bus: Any,
         dry_run: bool = False,
     ) -> AgentResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
         total_tokens = TokenUsage()
         total_cost = 0.0
         all_tool_calls: list[ToolCallRecord] = []
         model_used = ""
 
-        max_iterations = self.control.get("max_iterations", 10)
-
-        memory_context = ""
-        if self.memory:
-            try:
-                recall_limit = self.control.get("recall_limit", 10)
-                memories = await self.memory.recall(self.name, task, limit=recall_limit)
-                if memories:
-                    memory_context = "\n".join(
-                        f"- {m['content']}" for m in memories
-                    )
-                    tracer.record(
-                        TraceEvent(
-                            event_type=EventType.MEMORY_RECALL,
-                            agent_name=self.name,
-                            data={"memories_count": len(memories)},
-                        )
-                    )
-            except Exception as exc:
-                tracer.record(
-                    TraceEvent(
-                        event_type=EventType.ERROR,
-                        agent_name=self.name,
-                        data={"error": f"memory recall failed: {exc}"},
-                    )
-                )
+        # Control settings are read once per run; the loop only touches locals
+        control = self.control
+        max_iterations = control.get("max_iterations", 10)
+        confidence_threshold = control.get("confidence_threshold", 0.0)
+        recall_limit = control.get("recall_limit", 10)
+        tool_concurrency = control.get("tool_concurrency", 8)
+        history_limit = control.get("context_window_messages")
+        tool_output_max_chars = control.get("tool_output_max_chars")
+        checker = self._confidence_checker(confidence_threshold)
+
+        # Recall runs in the background while the prompt, tools and the first
+        # thinking event are prepared; it is awaited before the first LLM call
+        recall_task = (
+            asyncio.ensure_future(self._recall_memory(task, tracer, recall_limit))
+            if self.memory else None
+        )
 
-        system_prompt = self._build_system_prompt(memory_context)
         formatted_tools = self._format_tools_for_llm() if self.tools else None
+        tools_by_name = self._tool_index()
+        tool_allowed = self._tool_permissions()
+        # Caps how many tool calls from one LLM turn hit external services at once
+        tool_slots = asyncio.Semaphore(tool_concurrency)
 
         messages: list[dict[str, Any]] = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": self._build_system_prompt()},
             {"role": "user", "content": task},
         ]
 
@@ -108,6 +137,12 @@ class Agent:
                     data={"iteration": iteration + 1, "model": self.llm or llm_router.default_model},
                 )
             )
+            if recall_task is not None:
+                messages[0]["content"] = self._build_system_prompt(await recall_task)
+                recall_task = None
+
+            if history_limit is not None:
+                messages = _trim_history(messages, history_limit)
 
             # Call LLM
             try:
@@ -118,9 +153,10 @@ class Agent:
                     tools=formatted_tools,
                     temperature=self.temperature,
                     max_tokens=self.max_tokens,
+                    cache=self.cache,
                 )
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 tracer.record(
                     TraceEvent(
                         event_type=EventType.ERROR,
@@ -140,6 +176,14 @@ class Agent:
                 )
 
             model_used = response.model_used
+            if response.cached:
+                cache_event = TraceEvent(
+                    event_type=EventType.CACHE_HIT,
+                    agent_name=self.name,
+                    data={"model": model_used, "tokens_saved": response.tokens_saved},
+                )
+                tracer.record(cache_event)
+                await event_bus.emit(cache_event)
             total_tokens.input_tokens += response.input_tokens
             total_tokens.output_tokens += response.output_tokens
             total_cost += response.cost
@@ -183,11 +227,8 @@ class Agent:
                             "type": "function",
                             "function": {
                                 "name": tc["function"]["name"],
-                                "arguments": (
-                                    json.dumps(tc["function"]["arguments"])
-                                    if isinstance(tc["function"]["arguments"], dict)
-                                    else tc["function"]["arguments"]
-                                ),
+                                "arguments": tc["function"].get("arguments_json")
+                                or _encode_args(tc["function"]["arguments"]),
                             },
                         }
                         for tc in response.tool_calls
@@ -195,13 +236,30 @@ class Agent:
                 }
                 messages.append(assistant_msg)
 
-                for tc in response.tool_calls:
+                # Allowed calls run concurrently (up to tool_concurrency at a time);
+                # results are handled in call order so tool messages match the tool_calls
+                allowed = [
+                    tool_allowed[name] if name in tool_allowed
+                    else self.guardrails.is_tool_allowed(name)
+                    for name in (tc["function"]["name"] for tc in response.tool_calls)
+                ]
+                outcomes = iter(await asyncio.gather(*(
+                    self._run_tool(
+                        tc["function"]["name"], tc["function"]["arguments"], dry_run, tools_by_name, tool_slots
+                    )
+                    for tc, ok in zip(response.tool_calls, allowed)
+                    if ok
+                )))
+
+                trace_events: list[TraceEvent] = []
+                bus_events: list[TraceEvent] = []
+                for tc, ok in zip(response.tool_calls, allowed):
                     tool_name = tc["function"]["name"]
                     tool_args = tc["function"]["arguments"]
                     tool_call_id = tc["id"]
 
                     # Guardrails check
-                    if not self.guardrails.is_tool_allowed(tool_name):
+                    if not ok:
                         tool_result_str = f"Tool '{tool_name}' is not allowed by guardrails."
                         messages.append({
                             "role": "tool",
@@ -210,28 +268,7 @@ class Agent:
                         })
                         continue
 
-                    tc_start = time.time()
-
-                    if dry_run:
-                        dry_controller = DryRunController(enabled=True)
-                        result = dry_controller.simulate_tool(tool_name, tool_args)
-                    else:
-                        # Find and execute the tool
-                        result = None
-                        for t in self.tools:
-                            if t.name == tool_name:
-                                result = await t.execute(**tool_args)
-                                break
-                        if result is None:
-                            from agentforge.tools.base import ToolResult
-
-                            result = ToolResult(
-                                success=False,
-                                output="",
-                                error=f"Tool '{tool_name}' not found",
-                            )
-
-                    tc_duration = (time.time() - tc_start) * 1000
+                    result, tc_duration = next(outcomes)
 
                     record = ToolCallRecord(
                         tool_name=tool_name,
@@ -242,8 +279,8 @@ class Agent:
                     )
                     all_tool_calls.append(record)
 
-                    # Emit tool events
-                    tracer.record(
+                    # Tool events are queued and flushed once all results are in
+                    trace_events.append(
                         TraceEvent(
                             event_type=EventType.TOOL_CALL,
                             agent_name=self.name,
@@ -254,7 +291,7 @@ class Agent:
                             },
                         )
                     )
-                    tracer.record(
+                    trace_events.append(
                         TraceEvent(
                             event_type=EventType.TOOL_RESULT,
                             agent_name=self.name,
@@ -266,7 +303,7 @@ class Agent:
                             duration_ms=tc_duration,
                         )
                     )
-                    await event_bus.emit(
+                    bus_events.append(
                         TraceEvent(
                             event_type=EventType.TOOL_CALL,
                             agent_name=self.name,
@@ -276,13 +313,19 @@ class Agent:
                     )
 
                     # Append tool result to messages
-                    tool_result_str = result.output if result.success else f"Error: {result.error}"
+                    tool_result_str = _clip_tool_output(
+                        result.output if result.success else f"Error: {result.error}",
+                        tool_output_max_chars,
+                    )
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call_id,
                         "content": tool_result_str,
                     })
 
+                tracer.record_many(trace_events)
+                await event_bus.emit_many(bus_events)
+
                 # Continue the ReAct loop
                 continue
 
@@ -290,9 +333,7 @@ class Agent:
             output = response.content or ""
 
             # Confidence scoring
-            confidence_threshold = self.control.get("confidence_threshold", 0.0)
-            if confidence_threshold > 0:
-                checker = ConfidenceChecker(threshold=confidence_threshold)
+            if checker is not None:
                 score = checker.check(output)
                 tracer.record(
                     TraceEvent(
@@ -337,7 +378,7 @@ class Agent:
                         )
                     )
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return AgentResult(
                 output=output,
                 success=True,
@@ -350,7 +391,9 @@ class Agent:
             )
 
         # Max iterations exhausted without a final answer
-        duration = time.time() - start_time
+        if recall_task is not None:
+            recall_task.cancel()
+        duration = time.perf_counter() - start_time
         last_content = messages[-1].get("content", "") if messages else ""
         return AgentResult(
             output=last_content if isinstance(last_content, str) else str(last_content),
@@ -363,7 +406,85 @@ class Agent:
             model_used=model_used,
         )
 
+    async def _recall_memory(self, task: str, tracer: Any, recall_limit: int = 10) -> str:
+        """Recall memories relevant to ``task`` as prompt context; failures are traced, not raised."""
+        try:
+            memories = await self.memory.recall(self.name, task, limit=recall_limit)
+        except Exception as exc:
+            tracer.record(
+                TraceEvent(
+                    event_type=EventType.ERROR,
+                    agent_name=self.name,
+                    data={"error": f"memory recall failed: {exc}"},
+                )
+            )
+            return ""
+
+        if not memories:
+            return ""
+        tracer.record(
+            TraceEvent(
+                event_type=EventType.MEMORY_RECALL,
+                agent_name=self.name,
+                data={"memories_count": len(memories)},
+            )
+        )
+        return "\n".join(f"- {m['content']}" for m in memories)
+
+    async def _run_tool(
+        self,
+        tool_name: str,
+        tool_args: Any,
+        dry_run: bool,
+        tools_by_name: dict,
+        slots: asyncio.Semaphore,
+    ) -> tuple[ToolResult, float]:
+        """Execute (or simulate) one tool call; returns the result and its duration in ms."""
+        async with slots:
+            return await self._call_tool(tool_name, tool_args, dry_run, tools_by_name)
+
+    async def _call_tool(
+        self, tool_name: str, tool_args: Any, dry_run: bool, tools_by_name: dict
+    ) -> tuple[ToolResult, float]:
+        tc_start = time.perf_counter()
+        if dry_run:
+            result = DryRunController(enabled=True).simulate_tool(tool_name, tool_args)
+        else:
+            tool = tools_by_name.get(tool_name)
+            if tool is None:
+                result = ToolResult(success=False, output="", error=f"Tool '{tool_name}' not found")
+            else:
+                try:
+                    result = await tool.execute(**tool_args)
+                except Exception as e:
+                    # e.g. arguments that are not a mapping; keep sibling calls running
+                    result = ToolResult(success=False, output="", error=f"{type(e).__name__}: {e}")
+        return result, (time.perf_counter() - tc_start) * 1000
+
+    def _confidence_checker(self, threshold: float) -> ConfidenceChecker | None:
+        """The agent's checker, kept across runs while the threshold is unchanged."""
+        if threshold <= 0:
+            return None
+        if self._checker is None or self._checker.threshold != threshold:
+            self._checker = ConfidenceChecker(threshold=threshold)
+        return self._checker
+
     def _build_system_prompt(self, memory_context: str = "") -> str:
+        # The part before the memory section only changes if the agent is edited,
+        # so it is rebuilt only when one of its inputs differs from last time
+        key = (self.role, self.goal, self.backstory, self.instructions, tuple(self.tools))
+        if self._prompt_cache is None or self._prompt_cache[0] != key:
+            self._prompt_cache = (key, self._build_prompt_head())
+        head = self._prompt_cache[1]
+
+        if memory_context:
+            return (
+                f"{head}\n\nHere is relevant context from previous work:\n"
+                f"{memory_context}\n{_PROMPT_GUIDELINES}"
+            )
+        return f"{head}\n{_PROMPT_GUIDELINES}"
+
+    def _build_prompt_head(self) -> str:
         parts = [f"You are {self.role}.", f"\nYour goal: {self.goal}"]
 
         if self.backstory:
@@ -373,39 +494,38 @@ class Agent:
             parts.append(f"\n{self.instructions}")
 
         if self.tools:
-            tool_descriptions = []
-            for t in self.tools:
-                params_desc = ""
-                if t.parameters and "properties" in t.parameters:
-                    params_list = []
-                    for pname, pinfo in t.parameters["properties"].items():
-                        ptype = pinfo.get("type", "string")
-                        pdesc = pinfo.get("description", "")
-                        params_list.append(f"    - {pname} ({ptype}): {pdesc}")
-                    params_desc = "\n".join(params_list)
-                tool_descriptions.append(f"  • {t.name}: {t.description}\n{params_desc}")
-
-            parts.append("\nYou have access to the following tools:\n" + "\n".join(tool_descriptions))
-
-        if memory_context:
-            parts.append(f"\nHere is relevant context from previous work:\n{memory_context}")
-
-        parts.append(
-            "\nGuidelines:\n"
-            "- Use tools when you need external information or actions.\n"
-            "- When you have enough information, respond directly without tool calls.\n"
-            "- Be precise and factual."
-        )
+            tool_descriptions = "\n".join(
+                f"  • {t.name}: {t.description}\n"
+                + "\n".join(
+                    f"    - {pname} ({pinfo.get('type', 'string')}): {pinfo.get('description', '')}"
+                    for pname, pinfo in (t.parameters or {}).get("properties", {}).items()
+                )
+                for t in self.tools
+            )
+            parts.append(f"\nYou have access to the following tools:\n{tool_descriptions}")
 
         return "\n".join(parts)
 
     def _format_tools_for_llm(self) -> list[dict]:
-        formatted = []
-        for t in self.tools:
-            if not self.guardrails.is_tool_allowed(t.name):
-                continue
-            formatted.append(t.to_openai_schema())
-        return formatted
+        return self._tool_tables()[0]
+
+    def _tool_index(self) -> dict[str, Any]:
+        return self._tool_tables()[1]
+
+    def _tool_permissions(self) -> dict[str, bool]:
+        return self._tool_tables()[2]
+
+    def _tool_tables(self) -> tuple[list[dict], dict[str, Any], dict[str, bool]]:
+        """LLM tool schemas, the name -> tool index and the guardrail decision per tool,
+        rebuilt when tools or guardrails change."""
+        key = (tuple(self.tools), self.guardrails)
+        if self._tools_cache is None or self._tools_cache[0] != key:
+            permitted = {t.name: self.guardrails.is_tool_allowed(t.name) for t in self.tools}
+            formatted = [t.to_openai_schema() for t in self.tools if permitted[t.name]]
+            # First tool wins on duplicate names
+            index = {t.name: t for t in reversed(self.tools)}
+            self._tools_cache = (key, formatted, index, permitted)
+        return self._tools_cache[1:]
 
     @classmethod
     def from_config(cls, name: str, agent_config: dict, team_config: dict) -> "Agent":
@@ -440,9 +560,10 @@ class Agent:
             llm=agent_config.get("llm"),
             temperature=agent_config.get("temperature", team_config.get("temperature", 0.7)),
             max_tokens=agent_config.get("max_tokens", team_config.get("max_tokens", 4096)),
-            fallback=agent_config.get("fallback", []),
+            fallback=agent_config.get("fallback") or team_config.get("fallback_models", []),
             tools=tools,
             memory=memory,
             instructions=agent_config.get("instructions", ""),
             control=agent_config.get("control", {}),
+            cache=agent_config.get("cache"),
         )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import time
 import threading
 import webbrowser
@@ -15,10 +16,31 @@ from agentforge.control.dry_run import DryRunController
 from agentforge.core.result import CostSummary, ForgeResult, TokenUsage
 from agentforge.core.team import Team
 from agentforge.core.workflow import Workflow
+from agentforge.llm.cache import create_cache, create_semantic_cache
 from agentforge.llm.router import LLMRouter
 from agentforge.observe.events import EventBus
+from agentforge.memory.short_term import ShortTermMemory
 from agentforge.observe.tracer import EventType, TraceEvent, Tracer
 
+# Runs run() on a fresh event loop when called from inside a running one;
+# created on first use and shared so each call doesn't start a new pool
+_SYNC_POOL: concurrent.futures.ThreadPoolExecutor | None = None
+_SYNC_POOL_LOCK = threading.Lock()
+
+
+def _sync_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _SYNC_POOL
+    if _SYNC_POOL is None:
+        with _SYNC_POOL_LOCK:
+            if _SYNC_POOL is None:
+                _SYNC_POOL = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="forge-sync")
+    return _SYNC_POOL
+
+
+# Built Forge graphs keyed on (class, resolved path, mtime_ns, size)
+_FORGE_CACHE: dict[tuple, "Forge"] = {}
+_FORGE_CACHE_MAX = 32
+
 
 class Forge:
     """
@@ -32,25 +54,54 @@ class Forge:
         self.team = team
         self.workflow = workflow
         self.config = config or {}
+        # Summary fields read by the CLI header, derived once from the built graph
+        self.team_name = team.name
+        self.agent_names = tuple(team.agents)
+        self.step_count = len(workflow.steps)
         self.tracer = Tracer()
         self.event_bus = EventBus()
 
         team_config = self.config.get("team", {})
         observe_config = team_config.get("observe", {})
+        cache_config = team_config.get("cache", {})
+
+        db_path = team_config.get("memory", {}).get("path", ".agentforge/memory.db")
 
         self.llm_router = LLMRouter(
             default_model=team_config.get("llm", "openai/gpt-4o-mini"),
             cost_tracking=observe_config.get("cost_tracking", True),
+            cache=create_cache(cache_config, db_path=db_path),
+            cache_ttl=cache_config.get("ttl"),
+            semantic_cache=create_semantic_cache(cache_config, db_path=db_path),
         )
         self.dry_run_controller = DryRunController()
         self.approval_manager = ApprovalManager()
 
     @classmethod
-    def from_yaml(cls, path: Union[str, Path]) -> "Forge":
+    def from_yaml(cls, path: Union[str, Path], *, reuse: bool = False) -> "Forge":
+        """Build a Forge from a YAML file.
+
+        With ``reuse=True``, repeat calls for an unchanged file return the same
+        instance after ``reset_state()`` instead of rebuilding the team, tools,
+        and router. Only opt in when a single caller owns the Forge: the reset
+        replaces the tracer and drops event subscribers of the previous caller.
+        """
+        key = _forge_cache_key(cls, path) if reuse else None
+        if key is not None and key in _FORGE_CACHE:
+            forge = _FORGE_CACHE[key]
+            forge.reset_state()
+            return forge
+
         config = ConfigLoader.load(path)
         team = Team.from_config(config)
         workflow = Workflow.from_config(config, team)
-        return cls(team=team, workflow=workflow, config=config)
+        forge = cls(team=team, workflow=workflow, config=config)
+
+        if key is not None:
+            if len(_FORGE_CACHE) >= _FORGE_CACHE_MAX:
+                _FORGE_CACHE.pop(next(iter(_FORGE_CACHE)))
+            _FORGE_CACHE[key] = forge
+        return forge
 
     @classmethod
     def from_dict(cls, config: dict) -> "Forge":
@@ -59,6 +110,18 @@ class Forge:
         workflow = Workflow.from_config(config, team)
         return cls(team=team, workflow=workflow, config=config)
 
+    def reset_state(self):
+        """Drop per-run state (trace, subscribers, counters, short-term memory)."""
+        self.tracer = Tracer()
+        self.event_bus.clear()
+        self.llm_router.total_tokens = {"input": 0, "output": 0}
+        self.llm_router.total_cost = 0.0
+        self.llm_router.call_log = []
+        self.approval_manager = ApprovalManager()
+        for agent in self.team.agents.values():
+            if isinstance(agent.memory, ShortTermMemory):
+                agent.memory.reset()
+
     def run(
         self,
         task: str,
@@ -74,14 +137,11 @@ class Forge:
             loop = None
 
         if loop and loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(
-                    asyncio.run,
-                    self.arun(task, dry_run=dry_run, dashboard=dashboard, port=port),
-                )
-                return future.result()
+            future = _sync_pool().submit(
+                asyncio.run,
+                self.arun(task, dry_run=dry_run, dashboard=dashboard, port=port),
+            )
+            return future.result()
         else:
             return asyncio.run(self.arun(task, dry_run=dry_run, dashboard=dashboard, port=port))
 
@@ -98,14 +158,14 @@ class Forge:
         if dry_run is None:
             dry_run = self.config.get("team", {}).get("control", {}).get("dry_run", False)
 
+        # Start tracing (before the dashboard, which serves this run's tracer)
+        self.tracer = Tracer()
+        self.tracer.start()
+
         # Dashboard mode
         if dashboard:
             self._start_dashboard(port)
 
-        # Start tracing
-        self.tracer = Tracer()
-        self.tracer.start()
-
         self.tracer.record(
             TraceEvent(
                 event_type=EventType.WORKFLOW_START,
@@ -129,7 +189,7 @@ class Forge:
         )
 
         # Execute workflow
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             step_results = await self.workflow.execute(
                 user_input=task,
@@ -140,7 +200,7 @@ class Forge:
                 dry_run=dry_run,
             )
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.tracer.record(
                 TraceEvent(
                     event_type=EventType.ERROR,
@@ -164,7 +224,7 @@ class Forge:
                 error=str(e),
             )
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Build cost summary
         cost_breakdown = self.tracer.get_cost_breakdown()
@@ -212,19 +272,23 @@ class Forge:
 
     def _start_dashboard(self, port: int):
         """Start the dashboard server in a background thread."""
+        # Imported and built here rather than in the server thread, so the thread
+        # never takes the import lock while the workflow is running
+        from agentforge.dashboard.app import create_dashboard_app
+        import uvicorn
 
-        def _run_server():
-            from agentforge.dashboard.app import create_dashboard_app
-            import uvicorn
-
-            app = create_dashboard_app(
-                event_bus=self.event_bus,
-                tracer=self.tracer,
-                approval_manager=self.approval_manager,
-            )
-            uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+        app = create_dashboard_app(
+            event_bus=self.event_bus,
+            tracer=self.tracer,
+            approval_manager=self.approval_manager,
+        )
 
-        thread = threading.Thread(target=_run_server, daemon=True)
+        thread = threading.Thread(
+            target=uvicorn.run,
+            args=(app,),
+            kwargs={"host": "127.0.0.1", "port": port, "log_level": "warning"},
+            daemon=True,
+        )
         thread.start()
 
         time.sleep(0.5)
@@ -233,3 +297,12 @@ class Forge:
             webbrowser.open(f"http://localhost:{port}")
         except Exception:
             pass
+
+
+def _forge_cache_key(cls: type, path: Union[str, Path]) -> tuple | None:
+    try:
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None  # let ConfigLoader report the problem
+    return (cls, str(resolved), stat.st_mtime_ns, stat.st_size)
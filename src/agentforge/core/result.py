@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 
+from agentforge.observe.tracer import dumps_json
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolCallRecord:
     tool_name: str
     arguments: dict
@@ -15,7 +17,7 @@ class ToolCallRecord:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     input_tokens: int = 0
     output_tokens: int = 0
@@ -25,7 +27,7 @@ class TokenUsage:
         return self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class CostSummary:
     total_cost: float = 0.0
     total_tokens: TokenUsage = field(default_factory=TokenUsage)
@@ -34,7 +36,7 @@ class CostSummary:
     by_step: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     step_id: str
     agent_name: str
@@ -50,7 +52,7 @@ class StepResult:
     approved: bool | None = None  # None = no approval gate
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     output: str
     success: bool = True
@@ -63,7 +65,7 @@ class AgentResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ForgeResult:
     output: str
     steps: list[StepResult] = field(default_factory=list)
@@ -74,6 +76,7 @@ class ForgeResult:
     error: str | None = None
 
     def to_dict(self) -> dict:
+        total_tokens = self.cost.total_tokens
         return {
             "output": self.output,
             "success": self.success,
@@ -82,9 +85,9 @@ class ForgeResult:
             "cost": {
                 "total_cost": self.cost.total_cost,
                 "total_tokens": {
-                    "input": self.cost.total_tokens.input_tokens,
-                    "output": self.cost.total_tokens.output_tokens,
-                    "total": self.cost.total_tokens.total,
+                    "input": total_tokens.input_tokens,
+                    "output": total_tokens.output_tokens,
+                    "total": total_tokens.total,
                 },
                 "by_agent": self.cost.by_agent,
                 "by_model": self.cost.by_model,
@@ -107,5 +110,8 @@ class ForgeResult:
             ],
         }
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: int | None = 2) -> str:
+        # orjson (when installed) only does compact or 2-space output
+        if indent in (None, 2):
+            return dumps_json(self.to_dict(), pretty=indent == 2)
         return json.dumps(self.to_dict(), indent=indent)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """Binds an agent to a task with optional control flow (conditions, branching, retries)."""
 
@@ -22,27 +22,25 @@ class Step:
     on_success: str | None = None
     on_fail: str | None = None
     next: str | None = None  # loop to another step
+    # Output-format hint appended to the resolved task, derived once at construction
+    format_suffix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.output_format and self.output_format != "text":
+            self.format_suffix = f"\n\n[Respond in {self.output_format} format.]"
+        else:
+            self.format_suffix = ""
 
     @classmethod
     def from_config(cls, step_config: dict) -> "Step":
-        return cls(
-            id=step_config["id"],
-            agent=step_config["agent"],
-            task=step_config["task"],
-            output_format=step_config.get("output_format", "text"),
-            timeout=step_config.get("timeout"),
-            retry_on_fail=step_config.get("retry_on_fail"),
-            approval_gate=step_config.get("approval_gate", False),
-            dry_run=step_config.get("dry_run"),
-            condition=step_config.get("condition"),
-            save_as=step_config.get("save_as"),
-            on_success=step_config.get("on_success"),
-            on_fail=step_config.get("on_fail"),
-            next=step_config.get("next"),
-        )
-
-
-@dataclass
+        # Keys that aren't Step fields are ignored; missing ones take the field defaults
+        return cls(**{k: v for k, v in step_config.items() if k in _STEP_CONFIG_KEYS})
+
+
+_STEP_CONFIG_KEYS = frozenset(f.name for f in fields(Step) if f.init)
+
+
+@dataclass(slots=True)
 class ParallelGroup:
     steps: list[Step] = field(default_factory=list)
 
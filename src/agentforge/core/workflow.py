@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import re
 import time
 from typing import Any
@@ -11,6 +12,23 @@ from agentforge.core.step import ParallelGroup, Step
 from agentforge.core.result import StepResult
 from agentforge.observe.tracer import EventType, TraceEvent
 
+_TEMPLATE_RE = re.compile(r"\{\{([^}]+)\}\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(template: str) -> tuple:
+    """Split a task template into literal strings and ``(placeholder, path parts)`` tokens."""
+    tokens: list = []
+    pos = 0
+    for match in _TEMPLATE_RE.finditer(template):
+        if match.start() > pos:
+            tokens.append(template[pos:match.start()])
+        tokens.append((match.group(0), tuple(match.group(1).strip().split("."))))
+        pos = match.end()
+    if pos < len(template) or not tokens:
+        tokens.append(template[pos:])
+    return tuple(tokens)
+
 
 class Workflow:
 
@@ -18,6 +36,19 @@ class Workflow:
         self.steps = steps
         self.agents = agents
         self.control_config = control_config or {}
+        self.step_map = self._build_step_map(steps)
+
+    @staticmethod
+    def _build_step_map(steps: list) -> dict[str, int]:
+        """Map each step id (including parallel members) to its index in ``steps``."""
+        step_map: dict[str, int] = {}
+        for i, item in enumerate(steps):
+            if isinstance(item, Step):
+                step_map[item.id] = i
+            elif isinstance(item, ParallelGroup):
+                for s in item.steps:
+                    step_map[s.id] = i
+        return step_map
 
     @classmethod
     def from_config(cls, config: dict, team: Any) -> "Workflow":
@@ -50,18 +81,14 @@ class Workflow:
 
         step_results: list[StepResult] = []
         step_index = 0
-        step_map: dict[str, int] = {}  # step_id → index in self.steps
-
-        for i, item in enumerate(self.steps):
-            if isinstance(item, Step):
-                step_map[item.id] = i
-            elif isinstance(item, ParallelGroup):
-                for s in item.steps:
-                    step_map[s.id] = i
+        step_map = self.step_map  # resolved once at construction
 
         total_steps = len(self.steps)
-        visited: dict[str, int] = {}  # step_id → visit count (for loop control)
+        visits = [0] * total_steps  # step index → visit count (for loop control)
+        # Settings read once per run rather than once per step
+        agents = self.agents
         max_retries = self.control_config.get("max_retries", 3)
+        default_timeout = self.control_config.get("timeout")
 
         while step_index < total_steps:
             item = self.steps[step_index]
@@ -80,8 +107,8 @@ class Workflow:
             step: Step = item
 
             # Track visits for loop control
-            visited[step.id] = visited.get(step.id, 0) + 1
-            if visited[step.id] > max_retries + 1:
+            visits[step_index] += 1
+            if visits[step_index] > max_retries + 1:
                 step_index += 1
                 continue
 
@@ -92,15 +119,12 @@ class Workflow:
                     step_index += 1
                     continue
 
-            # Resolve task template
-            resolved_task = self._resolve_template(step.task, context)
-
-            # Append output_format hint so the agent knows the expected format
-            if step.output_format and step.output_format != "text":
-                resolved_task += f"\n\n[Respond in {step.output_format} format.]"
+            # Resolve task template, plus the output_format hint so the agent
+            # knows the expected format
+            resolved_task = self._resolve_template(step.task, context) + step.format_suffix
 
             # Get agent
-            agent = self.agents.get(step.agent)
+            agent = agents.get(step.agent)
             if not agent:
                 step_results.append(
                     StepResult(
@@ -114,32 +138,24 @@ class Workflow:
                 step_index += 1
                 continue
 
-            # Emit step start
-            tracer.record(
-                TraceEvent(
-                    event_type=EventType.STEP_START,
-                    step_id=step.id,
-                    agent_name=step.agent,
-                    data={"task": resolved_task, "step_num": step_index + 1, "total_steps": total_steps},
-                )
-            )
-            await event_bus.emit(
-                TraceEvent(
-                    event_type=EventType.STEP_START,
-                    step_id=step.id,
-                    agent_name=step.agent,
-                    data={"task": resolved_task, "step_num": step_index + 1, "total_steps": total_steps},
-                )
+            # Emit step start (one event serves both the trace and subscribers)
+            start_event = TraceEvent(
+                event_type=EventType.STEP_START,
+                step_id=step.id,
+                agent_name=step.agent,
+                data={"task": resolved_task, "step_num": step_index + 1, "total_steps": total_steps},
             )
+            tracer.record(start_event)
+            await event_bus.emit(start_event)
 
             # Determine dry_run for this step
             step_dry_run = step.dry_run if step.dry_run is not None else dry_run
 
             # Execute agent with optional timeout
-            step_start = time.time()
+            step_start = time.perf_counter()
             step_timeout = step.timeout
             if step_timeout is None:
-                step_timeout = self.control_config.get("timeout")
+                step_timeout = default_timeout
 
             try:
                 coro = agent.execute(
@@ -166,7 +182,7 @@ class Workflow:
                     cost=0.0,
                     error=f"Step '{step.id}' timed out after {step_timeout}s",
                 )
-            step_duration = time.time() - step_start
+            step_duration = time.perf_counter() - step_start
 
             step_result = StepResult(
                 step_id=step.id,
@@ -194,53 +210,32 @@ class Workflow:
                 context[step.save_as] = agent_result.output
 
             # Emit step end
-            tracer.record(
-                TraceEvent(
-                    event_type=EventType.STEP_END,
-                    step_id=step.id,
-                    agent_name=step.agent,
-                    data={
-                        "success": agent_result.success,
-                        "output_preview": agent_result.output[:200],
-                        "model": agent_result.model_used,
-                    },
-                    tokens={"input": agent_result.tokens.input_tokens, "output": agent_result.tokens.output_tokens},
-                    cost=agent_result.cost,
-                    duration_ms=step_duration * 1000,
-                )
-            )
-            await event_bus.emit(
-                TraceEvent(
-                    event_type=EventType.STEP_END,
-                    step_id=step.id,
-                    agent_name=step.agent,
-                    data={
-                        "success": agent_result.success,
-                        "model": agent_result.model_used,
-                    },
-                    tokens={"input": agent_result.tokens.input_tokens, "output": agent_result.tokens.output_tokens},
-                    cost=agent_result.cost,
-                    duration_ms=step_duration * 1000,
-                )
+            end_event = TraceEvent(
+                event_type=EventType.STEP_END,
+                step_id=step.id,
+                agent_name=step.agent,
+                data={
+                    "success": agent_result.success,
+                    "output_preview": agent_result.output[:200],
+                    "model": agent_result.model_used,
+                },
+                tokens={"input": agent_result.tokens.input_tokens, "output": agent_result.tokens.output_tokens},
+                cost=agent_result.cost,
+                duration_ms=step_duration * 1000,
             )
+            tracer.record(end_event)
+            await event_bus.emit(end_event)
 
             # Approval gate
             if step.approval_gate and approval_manager:
-                tracer.record(
-                    TraceEvent(
-                        event_type=EventType.APPROVAL_REQUESTED,
-                        step_id=step.id,
-                        agent_name=step.agent,
-                    )
-                )
-                await event_bus.emit(
-                    TraceEvent(
-                        event_type=EventType.APPROVAL_REQUESTED,
-                        step_id=step.id,
-                        agent_name=step.agent,
-                        data={"output_preview": agent_result.output[:500]},
-                    )
+                approval_event = TraceEvent(
+                    event_type=EventType.APPROVAL_REQUESTED,
+                    step_id=step.id,
+                    agent_name=step.agent,
+                    data={"output_preview": agent_result.output[:500]},
                 )
+                tracer.record(approval_event)
+                await event_bus.emit(approval_event)
 
                 approval = await approval_manager.request_approval(
                     step_id=step.id,
@@ -274,7 +269,7 @@ class Workflow:
 
             # Handle retry on failure
             if not agent_result.success and step.retry_on_fail:
-                retry_count = visited.get(step.id, 1) - 1
+                retry_count = visits[step_index] - 1
                 if retry_count < (step.retry_on_fail or 0):
                     tracer.record(
                         TraceEvent(
@@ -316,11 +311,7 @@ class Workflow:
     ) -> list[StepResult]:
 
         async def _run_step(step: Step) -> StepResult:
-            resolved_task = self._resolve_template(step.task, context)
-
-            # Append output_format hint
-            if step.output_format and step.output_format != "text":
-                resolved_task += f"\n\n[Respond in {step.output_format} format.]"
+            resolved_task = self._resolve_template(step.task, context) + step.format_suffix
 
             agent = self.agents.get(step.agent)
             if not agent:
@@ -338,13 +329,13 @@ class Workflow:
             )
 
             step_dry_run = step.dry_run if step.dry_run is not None else dry_run
-            step_start = time.time()
+            step_start = time.perf_counter()
             agent_result = await agent.execute(
                 task=resolved_task, context=context,
                 llm_router=llm_router, tracer=tracer, event_bus=event_bus,
                 dry_run=step_dry_run,
             )
-            step_duration = time.time() - step_start
+            step_duration = time.perf_counter() - step_start
 
             sr = StepResult(
                 step_id=step.id, agent_name=step.agent,
@@ -375,25 +366,58 @@ class Workflow:
             )
             return sr
 
-        results = await asyncio.gather(*[_run_step(s) for s in group.steps])
-        return list(results)
+        # A one-step group runs inline; gather and the semaphore add nothing there
+        if len(group.steps) == 1:
+            step = group.steps[0]
+            try:
+                return [await _run_step(step)]
+            except Exception as exc:
+                return [_failed_branch(step, exc)]
+
+        max_concurrency = self.control_config.get("max_concurrency")
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def _run_limited(step: Step) -> StepResult:
+            if semaphore is None:
+                return await _run_step(step)
+            async with semaphore:
+                return await _run_step(step)
+
+        outcomes = await asyncio.gather(
+            *[_run_limited(s) for s in group.steps], return_exceptions=True,
+        )
+
+        # One failing branch must not discard its siblings' results
+        results: list[StepResult] = []
+        for step, outcome in zip(group.steps, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                outcome = _failed_branch(step, outcome)
+            results.append(outcome)
+        return results
 
     def _resolve_template(self, template: str, context: dict) -> str:
-
-        def _replacer(match: re.Match) -> str:
-            path = match.group(1).strip()
-            parts = path.split(".")
-
+        tokens = _parse_template(template)
+        if len(tokens) == 1 and tokens[0].__class__ is str:
+            return tokens[0]
+
+        pieces = []
+        for token in tokens:
+            if token.__class__ is str:
+                pieces.append(token)
+                continue
+            placeholder, parts = token
             current: Any = context
             for part in parts:
                 if isinstance(current, dict) and part in current:
                     current = current[part]
                 else:
-                    return match.group(0)  # Leave unresolved if not found
-
-            return str(current)
-
-        return re.sub(r"\{\{([^}]+)\}\}", _replacer, template)
+                    pieces.append(placeholder)  # Leave unresolved if not found
+                    break
+            else:
+                pieces.append(str(current))
+        return "".join(pieces)
 
     def _evaluate_condition(self, condition: str, context: dict) -> bool:
         """Evaluate a simple condition (==, !=, >, <, contains, empty, etc.)."""
@@ -463,3 +487,11 @@ class Workflow:
 
         # Default: truthy check
         return bool(condition)
+
+
+def _failed_branch(step: Step, exc: Exception) -> StepResult:
+    return StepResult(
+        step_id=step.id, agent_name=step.agent,
+        output="", success=False, error=f"{type(exc).__name__}: {exc}",
+    )
+
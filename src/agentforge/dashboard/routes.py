@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from agentforge.observe.tracer import EventType
+
 
 class ApprovalRequest(BaseModel):
     approved: bool
@@ -21,22 +23,38 @@ def create_routes(
 ) -> APIRouter:
     router = APIRouter(prefix="/api")
 
+    # Trace events are append-only, so a payload stays valid until the count
+    # changes; repeated polls between events reuse it instead of rebuilding
+    def _memoized(build: Callable[[], Any]) -> Callable[[], Any]:
+        cached: list[Any] = [-1, None]
+
+        def get() -> Any:
+            count = len(tracer.events)
+            if cached[0] != count:
+                cached[0], cached[1] = count, build()
+            return cached[1]
+
+        return get
+
+    if tracer is not None:
+        timeline = _memoized(tracer.get_timeline)
+        cost_breakdown = _memoized(tracer.get_cost_breakdown)
+
     @router.get("/status")
     async def get_status():
         if tracer is None:
             return {"status": "idle", "events": 0}
 
-        events = tracer.get_timeline()
-        # Determine status from events
+        # Only the last event and the count are needed, not the full timeline
+        events = tracer.events
         status = "idle"
         if events:
-            last_event = events[-1]
-            etype = last_event.get("event_type", "")
-            if etype == "workflow_end":
+            etype = events[-1].event_type
+            if etype == EventType.WORKFLOW_END:
                 status = "completed"
-            elif etype == "error":
+            elif etype == EventType.ERROR:
                 status = "error"
-            elif etype == "approval_requested":
+            elif etype == EventType.APPROVAL_REQUESTED:
                 status = "awaiting_approval"
             else:
                 status = "running"
@@ -52,15 +70,15 @@ def create_routes(
         if tracer is None:
             return {"events": [], "cost_breakdown": {}}
         return {
-            "events": tracer.get_timeline(),
-            "cost_breakdown": tracer.get_cost_breakdown(),
+            "events": timeline(),
+            "cost_breakdown": cost_breakdown(),
         }
 
     @router.get("/costs")
     async def get_costs():
         if tracer is None:
             return {"total_cost": 0, "total_tokens": {"input": 0, "output": 0}}
-        return tracer.get_cost_breakdown()
+        return cost_breakdown()
 
     @router.post("/approve/{step_id}")
     async def approve_step(step_id: str, request: ApprovalRequest):
@@ -2,35 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from agentforge.observe.tracer import dumps_json
+
 
 class WebSocketManager:
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def broadcast(self, data: dict):
-        message = json.dumps(data, default=str)
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.append(connection)
-        for conn in disconnected:
-            self.disconnect(conn)
+        message = dumps_json(data)
+        # Send to every client at once so one slow connection doesn't delay the rest;
+        # the snapshot keeps connects/disconnects during the sends from affecting it
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(conn.send_text(message) for conn in connections), return_exceptions=True,
+        )
+        self.active_connections.difference_update(
+            conn for conn, result in zip(connections, results) if isinstance(result, Exception)
+        )
 
 
 def create_ws_router(ws_manager: WebSocketManager, approval_manager: Any = None) -> APIRouter:
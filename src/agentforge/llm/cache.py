@@ -0,0 +1,259 @@
+"""LLM response caches: exact-match (in-memory or SQLite) and opt-in semantic."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+
+class CacheBackend(Protocol):
+
+    async def get(self, key: str) -> dict | None:
+        ...
+
+    async def set(self, key: str, value: dict, ttl: float | None = None) -> None:
+        ...
+
+    async def delete(self, key: str) -> None:
+        ...
+
+
+def make_cache_key(
+    model: str,
+    messages: list[dict],
+    tools: list[dict] | None,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    payload = {
+        "model": model,
+        "messages": messages,
+        "tools": tools,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class InMemoryCache:
+    """Process-local LRU cache.
+
+    Values are stored serialized, like SQLiteCache, so a caller mutating a
+    returned response (e.g. tool-call arguments) can't corrupt later hits.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+
+    async def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return json.loads(value)
+
+    async def set(self, key: str, value: dict, ttl: float | None = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        self._entries[key] = (json.dumps(value), expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class SQLiteCache:
+    """Persistent cache stored alongside long-term memory."""
+
+    def __init__(self, db_path: str = ".agentforge/memory.db"):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL
+            )
+        """)
+        self._conn.commit()
+
+    async def get(self, key: str) -> dict | None:
+        def _run():
+            with self._db_lock:
+                return self._conn.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+
+        row = await asyncio.to_thread(_run)
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            await self.delete(key)
+            return None
+        return json.loads(value)
+
+    async def set(self, key: str, value: dict, ttl: float | None = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+
+        def _run():
+            with self._db_lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), expires_at),
+                )
+                self._conn.commit()
+
+        await asyncio.to_thread(_run)
+
+    async def delete(self, key: str) -> None:
+        def _run():
+            with self._db_lock:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+
+        await asyncio.to_thread(_run)
+
+    def close(self):
+        self._conn.close()
+
+
+class SemanticCache:
+    """Reuses a response when the latest message is close to a cached one.
+
+    Entries are partitioned by ``scope`` (the exact model, parameters and
+    earlier messages), so only the final message is compared by embedding
+    similarity. Embedding the whole conversation would let a long shared
+    system prompt dominate the vector and match unrelated tasks.
+    """
+
+    def __init__(self, path: str | None = None, threshold: float = 0.97, max_embeddings: int = 256):
+        self.threshold = threshold
+        self.max_embeddings = max_embeddings
+        self._collection = None
+        self._embed_fn = None
+        # Embeddings from recent lookups, so storing the response doesn't re-embed
+        self._embeddings: OrderedDict[str, Any] = OrderedDict()
+        self._embeddings_lock = threading.Lock()
+        try:
+            import chromadb
+
+            if path:
+                client = chromadb.PersistentClient(path=path)
+                name = "agentforge_llm_cache"
+            else:
+                # Ephemeral clients share one in-process store, so each cache
+                # gets its own collection rather than seeing other routers' entries
+                client = chromadb.EphemeralClient()
+                name = f"agentforge_llm_cache_{uuid.uuid4().hex}"
+            self._collection = client.get_or_create_collection(
+                name=name,
+                metadata={"hnsw:space": "cosine"},
+            )
+            self._embed_fn = getattr(self._collection, "_embedding_function", None)
+        except Exception:
+            self._collection = None
+
+    async def get(self, scope: str, text: str) -> dict | None:
+        if self._collection is None or self._embed_fn is None:
+            return None
+
+        def _run():
+            results = self._collection.query(
+                query_embeddings=[self._embedding(text)],
+                n_results=1,
+                where={"scope": scope},
+                include=["metadatas", "distances"],
+            )
+            if not results["ids"] or not results["ids"][0]:
+                return None
+            if results["distances"][0][0] > 1.0 - self.threshold:
+                return None
+            meta = results["metadatas"][0][0]
+            expires_at = meta.get("expires_at", 0.0)
+            if expires_at and expires_at < time.time():
+                self._collection.delete(ids=results["ids"][0][:1])
+                return None
+            return json.loads(meta["value"])
+
+        return await asyncio.to_thread(_run)
+
+    async def set(self, scope: str, text: str, value: dict, ttl: float | None = None) -> None:
+        if self._collection is None or self._embed_fn is None:
+            return
+        expires_at = time.time() + ttl if ttl else 0.0
+
+        def _run():
+            self._collection.upsert(
+                ids=[hashlib.sha256(f"{scope}\0{text}".encode()).hexdigest()],
+                embeddings=[self._embedding(text)],
+                metadatas=[{"scope": scope, "value": json.dumps(value), "expires_at": expires_at}],
+            )
+
+        await asyncio.to_thread(_run)
+
+    def _embedding(self, text: str) -> Any:
+        with self._embeddings_lock:
+            embedding = self._embeddings.get(text)
+            if embedding is not None:
+                self._embeddings.move_to_end(text)
+                return embedding
+
+        embedding = self._embed_fn([text])[0]
+        with self._embeddings_lock:
+            self._embeddings[text] = embedding
+            while len(self._embeddings) > self.max_embeddings:
+                self._embeddings.popitem(last=False)
+        return embedding
+
+
+def semantic_cache_key(
+    model: str,
+    messages: list[dict],
+    tools: list[dict] | None,
+    temperature: float,
+    max_tokens: int,
+) -> tuple[str, str]:
+    """Split a call into its exact-match scope and the text compared by similarity."""
+    scope = make_cache_key(model, messages[:-1], tools, temperature, max_tokens)
+    last = messages[-1] if messages else {}
+    content = last.get("content")
+    text = content if isinstance(content, str) else json.dumps(last, sort_keys=True, default=str)
+    return f"{last.get('role', '')}:{scope}", text
+
+
+def create_cache(config: dict, db_path: str = ".agentforge/memory.db") -> CacheBackend | None:
+    if not config.get("enabled", True):
+        return None
+
+    if config.get("backend", "memory") == "sqlite":
+        return SQLiteCache(db_path=db_path)
+    return InMemoryCache(max_entries=config.get("max_entries", 1024))
+
+
+def create_semantic_cache(config: dict, db_path: str = ".agentforge/memory.db") -> SemanticCache | None:
+    threshold = config.get("similarity_threshold")
+    if not config.get("enabled", True) or threshold is None:
+        return None
+
+    path = None
+    if config.get("backend", "memory") == "sqlite":
+        path = str(Path(db_path).parent / "chromadb")
+    return SemanticCache(path=path, threshold=threshold)
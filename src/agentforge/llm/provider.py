@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     content: str | None = None
     tool_calls: list[dict] = field(default_factory=list)
@@ -14,6 +14,8 @@ class LLMResponse:
     output_tokens: int = 0
     cost: float = 0.0
     latency_ms: float = 0.0
+    cached: bool = False
+    tokens_saved: int = 0
 
 
 class LLMError(Exception):
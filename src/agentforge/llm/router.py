@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import random
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -11,13 +12,15 @@ from typing import Any
 import litellm
 from litellm import acompletion
 
+from agentforge.llm.cache import CacheBackend, SemanticCache, make_cache_key, semantic_cache_key
 from agentforge.llm.provider import LLMError, LLMResponse
+from agentforge.observe.tracer import dumps_json
 
 # Suppress litellm's verbose logging
 litellm.suppress_debug_info = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CallRecord:
     model: str
     input_tokens: int = 0
@@ -26,13 +29,77 @@ class CallRecord:
     latency_ms: float = 0.0
     success: bool = True
     error: str | None = None
+    cached: bool = False
+
+
+# Providers that only reuse a prompt prefix when it is explicitly marked.
+# OpenAI and Gemini cache long prefixes automatically and need no marker.
+_EXPLICIT_PROMPT_CACHE_PROVIDERS = ("anthropic/", "bedrock/anthropic.", "vertex_ai/claude")
+
+
+def _with_prompt_cache(model: str, messages: list[dict]) -> list[dict]:
+    """Mark the system prompt as a cacheable prefix for providers that need it.
+
+    The system prompt is identical on every turn of an agent's ReAct loop, so
+    the provider can skip re-processing it. The caller's list is not modified.
+    """
+    if not model.startswith(_EXPLICIT_PROMPT_CACHE_PROVIDERS) or not messages:
+        return messages
+    first = messages[0]
+    if first.get("role") != "system" or not isinstance(first.get("content"), str):
+        return messages
+    system = {
+        "role": "system",
+        "content": [{
+            "type": "text",
+            "text": first["content"],
+            "cache_control": {"type": "ephemeral"},
+        }],
+    }
+    return [system, *messages[1:]]
+
+
+# Retry backoff: full exponential schedule capped at the max, with jitter so
+# concurrent callers hitting the same rate limit don't retry in lockstep
+_RETRY_BASE_DELAY = 0.25
+_RETRY_MAX_DELAY = 8.0
+
+# Provider errors worth retrying on the same model before falling back
+_TRANSIENT_ERRORS = (
+    litellm.RateLimitError,
+    litellm.APIConnectionError,
+    litellm.InternalServerError,
+    litellm.BadGatewayError,
+    litellm.ServiceUnavailableError,
+)
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return True
+    message = str(exc).lower()
+    return "rate" in message or "429" in message
+
+
+def _backoff_delay(attempt: int) -> float:
+    return min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt) * random.uniform(0.5, 1.5)
 
 
 class LLMRouter:
 
-    def __init__(self, default_model: str = "openai/gpt-4o-mini", cost_tracking: bool = True):
+    def __init__(
+        self,
+        default_model: str = "openai/gpt-4o-mini",
+        cost_tracking: bool = True,
+        cache: CacheBackend | None = None,
+        cache_ttl: float | None = None,
+        semantic_cache: SemanticCache | None = None,
+    ):
         self.default_model = default_model
         self.cost_tracking = cost_tracking
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.semantic_cache = semantic_cache
         self.total_tokens = {"input": 0, "output": 0}
         self.total_cost = 0.0
         self.call_log: list[CallRecord] = []
@@ -45,124 +112,222 @@ class LLMRouter:
         tools: list[dict] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        cache: bool | None = None,
+        race: bool = False,
     ) -> LLMResponse:
+        """Complete ``messages``, falling back through ``fallback`` models in order.
+
+        With ``race=True`` every model is called at once and the first success
+        wins; the other calls are cancelled. This trades extra provider spend
+        for latency when the primary model is slow or unavailable.
+        """
         models_to_try = [model or self.default_model] + (fallback or [])
         errors: list[str] = []
 
-        for current_model in models_to_try:
-            max_retries = 3
-            for attempt in range(max_retries):
-                start_ms = time.time() * 1000
-                try:
-                    kwargs: dict[str, Any] = {
-                        "model": current_model,
-                        "messages": messages,
-                        "temperature": temperature,
-                        "max_tokens": max_tokens,
-                    }
-                    if tools:
-                        kwargs["tools"] = tools
-                        kwargs["tool_choice"] = "auto"
-
-                    response = await acompletion(**kwargs)
-
-                    latency_ms = time.time() * 1000 - start_ms
-
-                    # Extract response data
-                    choice = response.choices[0]
-                    content = choice.message.content
-                    tool_calls_raw = choice.message.tool_calls or []
-
-                    # Parse tool calls
-                    parsed_tool_calls = []
-                    for tc in tool_calls_raw:
-                        try:
-                            args = (
-                                json.loads(tc.function.arguments)
-                                if isinstance(tc.function.arguments, str)
-                                else tc.function.arguments
-                            )
-                        except (ValueError, AttributeError):
-                            args = {}
-                        parsed_tool_calls.append(
-                            {
-                                "id": tc.id,
-                                "function": {
-                                    "name": tc.function.name,
-                                    "arguments": args,
-                                },
-                            }
-                        )
-
-                    # Token usage
-                    usage = getattr(response, "usage", None)
-                    input_tokens = getattr(usage, "prompt_tokens", 0) if usage else 0
-                    output_tokens = getattr(usage, "completion_tokens", 0) if usage else 0
-
-                    # Cost calculation
-                    cost = 0.0
-                    if self.cost_tracking:
-                        try:
-                            cost = litellm.completion_cost(completion_response=response)
-                        except Exception:
-                            cost = 0.0
-
-                    # Update totals
-                    self.total_tokens["input"] += input_tokens
-                    self.total_tokens["output"] += output_tokens
-                    self.total_cost += cost
-
-                    # Log
-                    self.call_log.append(
-                        CallRecord(
-                            model=current_model,
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            cost=cost,
-                            latency_ms=latency_ms,
-                            success=True,
-                        )
+        # Only deterministic calls are cached unless the caller opts in explicitly
+        has_cache = self.cache is not None or self.semantic_cache is not None
+        use_cache = has_cache and (cache if cache is not None else temperature == 0)
+        call_args = (messages, tools, temperature, max_tokens, use_cache, errors)
+
+        if race and len(models_to_try) > 1:
+            response = await self._race_models(models_to_try, call_args)
+            if response is not None:
+                return response
+        else:
+            for current_model in models_to_try:
+                response = await self._complete_with_model(current_model, *call_args)
+                if response is not None:
+                    return response
+
+        raise LLMError(
+            f"All models failed. Tried: {models_to_try}. Errors: {errors}",
+            models_tried=models_to_try,
+            errors=errors,
+        )
+
+    async def _race_models(self, models: list[str], call_args: tuple) -> LLMResponse | None:
+        pending = {asyncio.create_task(self._complete_with_model(m, *call_args)) for m in models}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    response = task.result()
+                    if response is not None:
+                        return response
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _complete_with_model(
+        self,
+        current_model: str,
+        messages: list[dict],
+        tools: list[dict] | None,
+        temperature: float,
+        max_tokens: int,
+        use_cache: bool,
+        errors: list[str],
+    ) -> LLMResponse | None:
+        """Call one model with retries; return None once it has failed for good."""
+        cache_key = semantic_key = None
+        if use_cache and self.cache is not None:
+            cache_key = make_cache_key(current_model, messages, tools, temperature, max_tokens)
+            cached = await self._cache_get(self.cache, current_model, cache_key)
+            if cached is not None:
+                return cached
+        if use_cache and self.semantic_cache is not None:
+            semantic_key = semantic_cache_key(current_model, messages, tools, temperature, max_tokens)
+            cached = await self._cache_get(self.semantic_cache, current_model, *semantic_key)
+            if cached is not None:
+                return cached
+
+        max_retries = 3
+        for attempt in range(max_retries):
+            start_ms = time.perf_counter() * 1000
+            try:
+                kwargs: dict[str, Any] = {
+                    "model": current_model,
+                    "messages": _with_prompt_cache(current_model, messages),
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                }
+                if tools:
+                    kwargs["tools"] = tools
+                    kwargs["tool_choice"] = "auto"
+
+                response = await acompletion(**kwargs)
+
+                latency_ms = time.perf_counter() * 1000 - start_ms
+
+                # Extract response data
+                choice = response.choices[0]
+                content = choice.message.content
+                tool_calls_raw = choice.message.tool_calls or []
+
+                # Parse tool calls
+                parsed_tool_calls = []
+                for tc in tool_calls_raw:
+                    try:
+                        raw_args = tc.function.arguments
+                        if isinstance(raw_args, str):
+                            args, args_json = json.loads(raw_args), raw_args
+                        else:
+                            args, args_json = raw_args, dumps_json(raw_args)
+                    except (ValueError, AttributeError):
+                        args, args_json = {}, "{}"
+                    parsed_tool_calls.append(
+                        {
+                            "id": tc.id,
+                            "function": {
+                                "name": tc.function.name,
+                                "arguments": args,
+                                # Encoded form echoed back in the assistant message
+                                "arguments_json": args_json,
+                            },
+                        }
                     )
 
-                    return LLMResponse(
-                        content=content,
-                        tool_calls=parsed_tool_calls,
-                        model_used=current_model,
+                # Token usage
+                usage = getattr(response, "usage", None)
+                input_tokens = getattr(usage, "prompt_tokens", 0) if usage else 0
+                output_tokens = getattr(usage, "completion_tokens", 0) if usage else 0
+
+                # Cost calculation
+                cost = 0.0
+                if self.cost_tracking:
+                    try:
+                        cost = litellm.completion_cost(completion_response=response)
+                    except Exception:
+                        cost = 0.0
+
+                # Update totals
+                self.total_tokens["input"] += input_tokens
+                self.total_tokens["output"] += output_tokens
+                self.total_cost += cost
+
+                # Log
+                self.call_log.append(
+                    CallRecord(
+                        model=current_model,
                         input_tokens=input_tokens,
                         output_tokens=output_tokens,
                         cost=cost,
                         latency_ms=latency_ms,
+                        success=True,
                     )
+                )
 
-                except Exception as e:
-                    error_name = type(e).__name__
-                    error_str = f"{current_model} (attempt {attempt + 1}): {error_name}: {e}"
-                    errors.append(error_str)
-
-                    self.call_log.append(
-                        CallRecord(
-                            model=current_model,
-                            latency_ms=time.time() * 1000 - start_ms,
-                            success=False,
-                            error=error_str,
-                        )
+                cache_value = {
+                    "content": content,
+                    "tool_calls": parsed_tool_calls,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                }
+                if cache_key is not None:
+                    await self._cache_set(self.cache, cache_value, cache_key)
+                if semantic_key is not None:
+                    await self._cache_set(self.semantic_cache, cache_value, *semantic_key)
+
+                return LLMResponse(
+                    content=content,
+                    tool_calls=parsed_tool_calls,
+                    model_used=current_model,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cost=cost,
+                    latency_ms=latency_ms,
+                )
+
+            except Exception as e:
+                error_name = type(e).__name__
+                error_str = f"{current_model} (attempt {attempt + 1}): {error_name}: {e}"
+                errors.append(error_str)
+
+                self.call_log.append(
+                    CallRecord(
+                        model=current_model,
+                        latency_ms=time.perf_counter() * 1000 - start_ms,
+                        success=False,
+                        error=error_str,
                     )
+                )
 
-                    # Rate limit → backoff and retry
-                    is_rate_limit = "rate" in str(e).lower() or "429" in str(e)
-                    if is_rate_limit and attempt < max_retries - 1:
-                        wait = 2**attempt
-                        await asyncio.sleep(wait)
-                        continue
-                    else:
-                        break
+                # Rate limit or transient provider error → backoff and retry
+                if _is_transient(e) and attempt < max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+                else:
+                    break
 
-        raise LLMError(
-            f"All models failed. Tried: {models_to_try}. Errors: {errors}",
-            models_tried=models_to_try,
-            errors=errors,
+        return None
+
+    async def _cache_get(self, backend: Any, model: str, *key: str) -> LLMResponse | None:
+        start_ms = time.perf_counter() * 1000
+        try:
+            hit = await backend.get(*key)
+        except Exception:
+            return None  # A broken cache must never block the real call
+        if hit is None:
+            return None
+
+        latency_ms = time.perf_counter() * 1000 - start_ms
+        self.call_log.append(CallRecord(model=model, latency_ms=latency_ms, cached=True))
+        return LLMResponse(
+            content=hit.get("content"),
+            tool_calls=hit.get("tool_calls", []),
+            model_used=model,
+            latency_ms=latency_ms,
+            cached=True,
+            tokens_saved=hit.get("input_tokens", 0) + hit.get("output_tokens", 0),
         )
 
+    async def _cache_set(self, backend: Any, value: dict, *key: str) -> None:
+        try:
+            await backend.set(*key, value, self.cache_ttl)
+        except Exception:
+            pass
+
     def get_cost_summary(self) -> dict:
         by_model: dict[str, dict] = {}
         for record in self.call_log:
@@ -4,14 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import queue
 import sqlite3
 import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from typing import Any
 
 from agentforge.memory.base import BaseMemory
 
+# Applied to every connection. WAL lets recalls read while a store commits, and
+# NORMAL sync skips the per-commit fsync that WAL makes unnecessary for durability
+# against crashes of this process
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
 
 class LongTermMemory(BaseMemory):
 
@@ -19,18 +35,41 @@ class LongTermMemory(BaseMemory):
         self.db_path = db_path
         self.shared = shared
         self._chroma_collection = None
+        self._embed_fn = None
+
+        # Query embeddings are cached so repeat recalls don't re-embed the same text
+        self._embedding_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+        self._embedding_cache_ttl = float(os.environ.get("AGENTFORGE_EMBED_CACHE_TTL", "3600"))
+        self._embedding_cache_size = int(os.environ.get("AGENTFORGE_EMBED_CACHE_MAXSIZE", "2048"))
+        if self._embedding_cache_size < 1:
+            raise ValueError("AGENTFORGE_EMBED_CACHE_MAXSIZE must be at least 1")
 
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Initialize SQLite
-        self._conn = sqlite3.connect(db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
+        # Initialize SQLite: one writer connection guarded by a lock, plus a pool of
+        # reader connections so recalls don't queue behind each other or behind writes.
+        # An in-memory database only exists on its own connection, so it has no readers.
+        self._conn = self._connect()
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
         self._db_lock = threading.Lock()
+        self._pooled_reads = db_path != ":memory:"
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
         self._init_db()
 
-        # Try to initialize ChromaDB (optional dependency for semantic search)
-        self._init_chromadb()
+        # Try to initialize ChromaDB (optional dependency for semantic search). An
+        # in-memory database has no directory to keep a vector index next to.
+        if db_path != ":memory:":
+            self._init_chromadb()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
     def _init_db(self):
         """Create tables if they don't exist."""
@@ -65,11 +104,37 @@ class LongTermMemory(BaseMemory):
                 name="agentforge_memories",
                 metadata={"hnsw:space": "cosine"},
             )
+            self._embed_fn = getattr(self._chroma_collection, "_embedding_function", None)
         except ImportError:
             self._chroma_collection = None
         except Exception:
             self._chroma_collection = None
 
+    def _query_chroma(self, query: str, limit: int, where: dict | None) -> Any:
+        if self._embed_fn is None:
+            return self._chroma_collection.query(query_texts=[query], n_results=limit, where=where)
+        return self._chroma_collection.query(
+            query_embeddings=[self._query_embedding(query)], n_results=limit, where=where,
+        )
+
+    def _query_embedding(self, query: str) -> Any:
+        """Embed ``query``, reusing a cached vector younger than the TTL."""
+        now = time.monotonic()
+        cache = self._embedding_cache
+        with self._embedding_cache_lock:
+            hit = cache.get(query)
+            if hit is not None and now - hit[0] < self._embedding_cache_ttl:
+                cache.move_to_end(query)
+                return hit[1]
+
+        embedding = self._embed_fn([query])[0]
+        with self._embedding_cache_lock:
+            cache[query] = (now, embedding)
+            cache.move_to_end(query)
+            while len(cache) > self._embedding_cache_size:
+                cache.popitem(last=False)
+        return embedding
+
     async def _db_execute(self, sql: str, params: tuple = ()) -> None:
         def _run():
             with self._db_lock:
@@ -85,8 +150,17 @@ class LongTermMemory(BaseMemory):
 
     async def _db_query(self, sql: str, params: tuple = ()) -> list:
         def _run():
-            with self._db_lock:
-                return self._conn.execute(sql, params).fetchall()
+            if not self._pooled_reads:
+                with self._db_lock:
+                    return self._conn.execute(sql, params).fetchall()
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                self._readers.put(conn)
         return await asyncio.to_thread(_run)
 
     async def _db_commit(self) -> None:
@@ -125,32 +199,19 @@ class LongTermMemory(BaseMemory):
         if self._chroma_collection is not None:
             try:
                 where_filter = None if self.shared else {"agent_name": agent_name}
-                results = await asyncio.to_thread(
-                    self._chroma_collection.query,
-                    query_texts=[query],
-                    n_results=limit,
-                    where=where_filter,
-                )
+                results = await asyncio.to_thread(self._query_chroma, query, limit, where_filter)
 
                 if results and results["documents"] and results["documents"][0]:
                     memories = []
                     for i, doc in enumerate(results["documents"][0]):
                         meta = results["metadatas"][0][i] if results["metadatas"] else {}
-                        mem_id = results["ids"][0][i] if results["ids"] else None
-
-                        if mem_id:
-                            now = datetime.now(timezone.utc).isoformat()
-                            await self._db_execute(
-                                "UPDATE memories SET accessed_at = ?, access_count = access_count + 1 WHERE id = ?",
-                                (now, mem_id),
-                            )
-                            await self._db_commit()
-
                         memories.append({
                             "content": doc,
                             "importance": meta.get("importance", 0.5),
                             "created_at": meta.get("created_at", ""),
                         })
+                    if results["ids"]:
+                        await self._mark_accessed([mem_id for mem_id in results["ids"][0] if mem_id])
                     return memories
             except Exception:
                 pass
@@ -181,19 +242,25 @@ class LongTermMemory(BaseMemory):
         scored.sort(key=lambda x: x[0], reverse=True)
         results_list = []
         for _, row in scored[:limit]:
-            now = datetime.now(timezone.utc).isoformat()
-            await self._db_execute(
-                "UPDATE memories SET accessed_at = ?, access_count = access_count + 1 WHERE id = ?",
-                (now, row["id"]),
-            )
             results_list.append({
                 "content": row["content"],
                 "importance": row["importance"],
                 "created_at": row["created_at"],
             })
-        await self._db_commit()
+        await self._mark_accessed([row["id"] for _, row in scored[:limit]])
         return results_list
 
+    async def _mark_accessed(self, ids: list[str]) -> None:
+        if not ids:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        placeholders = ",".join("?" * len(ids))
+        await self._db_execute_commit(
+            "UPDATE memories SET accessed_at = ?, access_count = access_count + 1 "
+            f"WHERE id IN ({placeholders})",
+            (now, *ids),
+        )
+
     async def forget(self, min_importance: float = 0.1, max_age_days: int = 30):
         cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
         rows = await self._db_query(
@@ -231,6 +298,7 @@ class LongTermMemory(BaseMemory):
                         name="agentforge_memories",
                         metadata={"hnsw:space": "cosine"},
                     )
+                    self._embed_fn = getattr(self._chroma_collection, "_embedding_function", None)
                 except Exception:
                     pass
         else:
@@ -241,4 +309,9 @@ class LongTermMemory(BaseMemory):
         await self._db_commit()
 
     def close(self):
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
         self._conn.close()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import uuid
 from datetime import datetime, timezone
 
@@ -21,6 +22,7 @@ class ShortTermMemory(BaseMemory):
             "id": memory_id,
             "agent_name": agent_name,
             "content": content,
+            "content_lower": content.lower(),
             "importance": importance,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "metadata": metadata or {},
@@ -38,20 +40,23 @@ class ShortTermMemory(BaseMemory):
         query_words = set(query.lower().split())
         candidates = self._store if self.shared else [m for m in self._store if m["agent_name"] == agent_name]
 
-        scored: list[tuple[float, dict]] = []
-        for mem in candidates:
-            content_lower = mem["content"].lower()
-            # Score: fraction of query words found + importance bonus
-            matches = sum(1 for w in query_words if w in content_lower)
-            score = (matches / max(len(query_words), 1)) + mem["importance"] * 0.3
-            scored.append((score, mem))
+        word_count = max(len(query_words), 1)
+
+        def score(mem: dict) -> float:
+            # Fraction of query words found + importance bonus
+            content_lower = mem["content_lower"]
+            matches = sum(w in content_lower for w in query_words)
+            return matches / word_count + mem["importance"] * 0.3
 
-        scored.sort(key=lambda x: x[0], reverse=True)
         return [
             {"content": m["content"], "importance": m["importance"], "created_at": m["created_at"]}
-            for _, m in scored[:limit]
+            for m in heapq.nlargest(limit, candidates, key=score)
         ]
 
+    def reset(self):
+        """Synchronously drop every stored item."""
+        self._store.clear()
+
     async def clear(self, agent_name: str | None = None):
         if agent_name is None:
             self._store.clear()
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Callable, Coroutine
+import asyncio
+from typing import Callable, Coroutine, Iterable
 
 from agentforge.observe.tracer import TraceEvent
 
@@ -26,12 +27,37 @@ class EventBus:
             except Exception:
                 pass  # Don't let subscriber errors break execution
 
-        for async_cb in self._subscribers:
-            try:
-                await async_cb(event)
-            except Exception:
-                pass
+        # Async subscribers run concurrently so a slow one (e.g. a websocket
+        # broadcast) doesn't hold up the others
+        async_subscribers = self._subscribers
+        if len(async_subscribers) == 1:
+            await _notify(async_subscribers[0], event)
+        elif async_subscribers:
+            await asyncio.gather(*(_notify(cb, event) for cb in async_subscribers))
+
+    async def emit_many(self, events: Iterable[TraceEvent]):
+        """Emit several events in order without a separate ``emit()`` call per event."""
+        sync_subscribers = self._sync_subscribers
+        async_subscribers = self._subscribers
+        for event in events:
+            for sync_cb in sync_subscribers:
+                try:
+                    sync_cb(event)
+                except Exception:
+                    pass
+
+            if len(async_subscribers) == 1:
+                await _notify(async_subscribers[0], event)
+            elif async_subscribers:
+                await asyncio.gather(*(_notify(cb, event) for cb in async_subscribers))
 
     def clear(self):
         self._subscribers.clear()
         self._sync_subscribers.clear()
+
+
+async def _notify(callback: Callable[[TraceEvent], Coroutine], event: TraceEvent):
+    try:
+        await callback(event)
+    except Exception:
+        pass
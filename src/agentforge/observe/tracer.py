@@ -8,6 +8,24 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Any, Iterable
+
+# orjson is optional; it serializes trace payloads several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: Any, pretty: bool = False) -> str:
+    """Serialize trace data to a JSON string, stringifying unknown types."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(data, default=str, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; fall back to the stdlib encoder
+    return json.dumps(data, indent=2 if pretty else None, default=str)
 
 
 class EventType(str, Enum):
@@ -25,9 +43,10 @@ class EventType(str, Enum):
     APPROVAL_RECEIVED = "approval_received"
     ERROR = "error"
     RETRY = "retry"
+    CACHE_HIT = "cache_hit"
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceEvent:
     event_type: EventType
     timestamp: float = field(default_factory=time.time)
@@ -38,6 +57,14 @@ class TraceEvent:
     cost: float = 0.0
     duration_ms: float = 0.0
 
+    @property
+    def tokens_total(self) -> int:
+        return self.tokens.get("input", 0) + self.tokens.get("output", 0)
+
+    @property
+    def cost_display(self) -> str:
+        return f"${self.cost or 0:.4f}"
+
     def to_dict(self) -> dict:
         return {
             "event_type": self.event_type.value,
@@ -62,6 +89,10 @@ class Tracer:
         with self._lock:
             self.events.append(event)
 
+    def record_many(self, events: Iterable[TraceEvent]):
+        with self._lock:
+            self.events.extend(events)
+
     def start(self):
         self.start_time = time.time()
 
@@ -131,4 +162,4 @@ class Tracer:
         }
         out_path = Path(path)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(data, indent=2, default=str))
+        out_path.write_text(dumps_json(data, pretty=True), encoding="utf-8")
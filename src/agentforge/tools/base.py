@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, get_type_hints
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     success: bool
     output: str
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from typer.testing import CliRunner
+import subprocess
+import sys
 
-from agentforge.cli.commands import app
+import io
+
+from rich.console import Console
+from rich.text import Text
+from click.testing import CliRunner
+
+from agentforge.cli.commands import _EventBatcher, _step_agent_refs, app
 
 
 runner = CliRunner()
@@ -23,8 +30,59 @@ class TestValidateCommand:
         assert result.exit_code != 0 or "error" in result.stdout.lower() or "not found" in result.stdout.lower()
 
 
+class TestStepAgentRefs:
+    def test_flattens_parallel_blocks(self):
+        steps = [
+            {"id": "a", "agent": "x"},
+            {"parallel": [{"id": "b", "agent": "y"}, {"id": "c", "agent": "z"}]},
+        ]
+        assert list(_step_agent_refs(steps)) == [("x", "a"), ("y", None), ("z", None)]
+
+
 class TestInitCommand:
     def test_init(self, tmp_path):
         result = runner.invoke(app, ["init", str(tmp_path / "test_project")])
         assert result.exit_code == 0
         assert (tmp_path / "test_project" / "agents.yaml").exists()
+
+    def test_init_unknown_template_writes_default(self, tmp_path):
+        project = tmp_path / "fallback_project"
+        result = runner.invoke(app, ["init", str(project), "--template", "missing"])
+        assert result.exit_code == 0
+        assert "assistant:" in (project / "agents.yaml").read_text()
+        assert (project / "run.py").read_text().startswith("from agentforge import Forge")
+        assert (project / ".gitignore").read_text() == ".agentforge/\n.env\n__pycache__/\n*.pyc\n"
+
+
+class TestImportCost:
+    def test_cli_import_skips_heavy_deps(self):
+        code = (
+            "import sys, agentforge.cli.commands; "
+            "print('litellm' in sys.modules or 'pydantic' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+
+class TestEventBatcher:
+    def test_flushes_when_batch_full(self):
+        buf = io.StringIO()
+        batcher = _EventBatcher(Console(file=buf), max_lines=2, max_delay=60)
+        batcher.add("first")
+        assert buf.getvalue() == ""
+        batcher.add("second")
+        assert buf.getvalue().splitlines() == ["first", "second"]
+
+    def test_explicit_flush(self):
+        buf = io.StringIO()
+        batcher = _EventBatcher(Console(file=buf), max_lines=10, max_delay=60)
+        batcher.add("[bold]only[/bold]")
+        batcher.flush()
+        assert buf.getvalue().strip() == "only"
+
+    def test_text_lines_printed_verbatim(self):
+        buf = io.StringIO()
+        batcher = _EventBatcher(Console(file=buf), max_lines=10, max_delay=60)
+        batcher.add(Text("[agent → model]", style="dim"))
+        batcher.flush()
+        assert buf.getvalue().strip() == "[agent → model]"
@@ -36,3 +36,10 @@ class TestDeepMerge:
         r2 = merge_with_defaults({"team": {"name": "B"}})
         assert r1["team"]["name"] == "A"
         assert r2["team"]["name"] == "B"
+
+    def test_mutating_result_does_not_touch_defaults(self):
+        result = merge_with_defaults({})
+        result["agent_defaults"]["tools"].append("web_search")
+        result["team"]["memory"]["enabled"] = False
+        assert DEFAULTS["agent_defaults"]["tools"] == []
+        assert DEFAULTS["team"]["memory"]["enabled"] is True
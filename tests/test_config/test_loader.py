@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import os
+
 import pytest
 import yaml
 
-from agentforge.config.loader import ConfigLoader, ConfigError
+from agentforge.config.loader import ConfigLoader, ConfigError, _load_cached
+from agentforge.config.schema import ForgeConfig
 
 
 @pytest.fixture
@@ -41,6 +44,29 @@ class TestConfigLoaderLoad:
             ConfigLoader.load(invalid_yaml_file)
 
 
+class TestConfigLoaderCache:
+    def test_repeated_load_hits_cache(self, valid_yaml_file):
+        ConfigLoader.clear_cache()
+        ConfigLoader.load(valid_yaml_file)
+        ConfigLoader.load(valid_yaml_file)
+        assert _load_cached.cache_info().hits == 1
+
+    def test_cached_result_is_a_copy(self, valid_yaml_file):
+        first = ConfigLoader.load(valid_yaml_file)
+        first["team"]["name"] = "Mutated"
+        second = ConfigLoader.load(valid_yaml_file)
+        assert second["team"]["name"] == "Test Team"
+
+    def test_modified_file_is_reloaded(self, valid_yaml_file, sample_config):
+        ConfigLoader.load(valid_yaml_file)
+        sample_config["team"]["name"] = "Renamed Team"
+        with open(valid_yaml_file, "w") as f:
+            f.write(yaml.dump(sample_config, default_flow_style=False))
+        st = os.stat(valid_yaml_file)
+        os.utime(valid_yaml_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert ConfigLoader.load(valid_yaml_file)["team"]["name"] == "Renamed Team"
+
+
 class TestConfigLoaderValidate:
     def test_validate_valid_config(self, sample_config):
         config = ConfigLoader.validate(sample_config)
@@ -58,3 +84,29 @@ class TestConfigLoaderValidate:
     def test_validate_returns_dict(self, sample_config):
         config = ConfigLoader.validate(sample_config)
         assert isinstance(config, dict)
+
+    def test_validate_without_team_uses_defaults(self):
+        config = ConfigLoader.validate({
+            "agents": {"a": {"role": "R", "goal": "G"}},
+            "workflow": {"steps": [{"id": "s", "agent": "a", "task": "t"}]},
+        })
+        assert config["team"]["name"] == "AgentForge Team"
+        assert config["team"]["memory"]["backend"] == "sqlite"
+
+    def test_validate_partial_team_keeps_default_sections(self, sample_config):
+        del sample_config["team"]["observe"]
+        config = ConfigLoader.validate(sample_config)
+        assert config["team"]["observe"]["log_level"] == "info"
+        assert config["team"]["memory"]["enabled"] is False
+
+
+class TestForgeConfigLoad:
+    def test_load_returns_model(self, valid_yaml_file):
+        config = ForgeConfig.load(valid_yaml_file)
+        assert isinstance(config, ForgeConfig)
+        assert config.team.name == "Test Team"
+        assert config == ForgeConfig.model_validate(ConfigLoader.load(valid_yaml_file))
+
+    def test_load_nonexistent_file(self):
+        with pytest.raises(ConfigError):
+            ForgeConfig.load("/nonexistent/agents.yaml")
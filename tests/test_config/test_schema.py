@@ -28,6 +28,23 @@ class TestTeamConfig:
         assert team.temperature is not None or team.temperature == 0
         assert team.max_tokens is not None or team.max_tokens == 0
 
+    def test_temperature_out_of_range_raises(self):
+        with pytest.raises(ValidationError):
+            TeamConfig(name="T", temperature=2.5)
+
+    def test_unknown_key_raises(self):
+        with pytest.raises(ValidationError, match="temprature"):
+            TeamConfig(name="T", temprature=0.2)
+
+    def test_documented_fallback_models_accepted(self):
+        team = TeamConfig(name="T", fallback_models=["anthropic/claude-3-haiku"])
+        assert team.fallback_models == ["anthropic/claude-3-haiku"]
+
+    def test_is_frozen(self):
+        team = TeamConfig(name="T")
+        with pytest.raises(ValidationError):
+            team.name = "Other"
+
     def test_memory_config_defaults(self):
         mem = MemoryConfig()
         assert mem.enabled is not None
@@ -44,6 +61,10 @@ class TestAgentConfig:
         agent = AgentConfig(role="R", goal="G", tools=["web_search", "calculator"])
         assert len(agent.tools) == 2
 
+    def test_agent_confidence_threshold_accepted(self):
+        agent = AgentConfig(role="R", goal="G", control={"confidence_threshold": 0.5})
+        assert agent.control.confidence_threshold == 0.5
+
 
 class TestStepConfig:
     def test_valid_step(self):
@@ -85,6 +106,10 @@ class TestControlConfig:
         assert ctrl.dry_run is not None
         assert ctrl.max_retries is not None
 
+    def test_max_concurrency_must_be_positive(self):
+        with pytest.raises(ValidationError):
+            ControlConfig(max_concurrency=0)
+
 
 class TestForgeConfig:
     def test_valid_full_config(self, sample_config):
@@ -100,3 +125,29 @@ class TestForgeConfig:
     def test_missing_agents_raises(self):
         with pytest.raises(ValidationError):
             ForgeConfig(team=TeamConfig(name="T"), workflow=WorkflowConfig(steps=[]))
+
+    def test_from_trusted_dict_round_trips(self, sample_config):
+        sample_config["workflow"]["steps"].append({
+            "parallel": [{"id": "p1", "agent": "assistant", "task": "T"}],
+        })
+        validated = ForgeConfig.model_validate(sample_config)
+        rebuilt = ForgeConfig.from_trusted_dict(validated.model_dump())
+        assert rebuilt == validated
+        assert isinstance(rebuilt.team.memory, MemoryConfig)
+        assert isinstance(rebuilt.workflow.steps[0], StepConfig)
+        assert rebuilt.workflow.steps[1].parallel[0].id == "p1"
+
+    def test_unknown_agent_in_parallel_step_raises(self, sample_config):
+        sample_config["workflow"]["steps"].append({
+            "parallel": [{"id": "p1", "agent": "ghost", "task": "T"}],
+        })
+        with pytest.raises(ValidationError, match="Parallel step 'p1' references agent 'ghost'"):
+            ForgeConfig.model_validate(sample_config)
+
+    def test_step_errors_report_only_the_matching_variant(self, sample_config):
+        sample_config["workflow"]["steps"] = [{"id": "s1", "task": "T"}]
+        with pytest.raises(ValidationError) as exc_info:
+            ForgeConfig.model_validate(sample_config)
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("workflow", "steps", 0, "step", "agent")
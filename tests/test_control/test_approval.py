@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import io
+
 import pytest
 from unittest.mock import patch
 
@@ -18,6 +22,12 @@ class TestApprovalResult:
         result = ApprovalResult(approved=False, reason="Too risky")
         assert result.approved is False
 
+    def test_is_immutable(self):
+        result = ApprovalResult(approved=True)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.approved = False
+
 
 class TestApprovalManager:
     def test_init_cli_mode(self):
@@ -41,3 +51,51 @@ class TestApprovalManager:
         mgr = ApprovalManager(mode="cli")
         result = await mgr.request_approval("step1", "agent1", "Action", "output text")
         assert result.approved is False
+
+    @pytest.mark.asyncio
+    async def test_dashboard_resolve(self):
+        mgr = ApprovalManager(mode="dashboard")
+        pending = asyncio.create_task(
+            mgr.request_approval("step1", "agent1", "Action", "output text")
+        )
+        await asyncio.sleep(0)
+        mgr.resolve_approval("step1", approved=False, reason="No")
+        result = await pending
+        assert result.approved is False
+        assert result.reason == "No"
+        assert mgr.pending_approvals == {}
+
+    @pytest.mark.asyncio
+    async def test_dashboard_cancel_cleans_up(self):
+        mgr = ApprovalManager(mode="dashboard")
+        pending = asyncio.create_task(
+            mgr.request_approval("step1", "agent1", "Action", "output text")
+        )
+        await asyncio.sleep(0)
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        assert mgr.pending_approvals == {}
+        mgr.resolve_approval("step1", approved=True)  # late response is ignored
+
+    def test_resolve_unknown_step_is_ignored(self):
+        mgr = ApprovalManager(mode="dashboard")
+        mgr.resolve_approval("missing", approved=True)
+        assert mgr.pending_approvals == {}
+
+    @pytest.mark.asyncio
+    @patch("agentforge.control.approval.Prompt.ask", return_value="e")
+    async def test_cli_edit_reads_until_blank_line(self, mock_ask, monkeypatch):
+        monkeypatch.setattr("sys.stdin", io.StringIO("line one\nline two\n\nignored\n"))
+        mgr = ApprovalManager(mode="cli")
+        result = await mgr.request_approval("step1", "agent1", "Action", "output text")
+        assert result.approved is True
+        assert result.edited_output == "line one\nline two"
+
+    @pytest.mark.asyncio
+    @patch("agentforge.control.approval.Prompt.ask", return_value="e")
+    async def test_cli_edit_empty_keeps_output(self, mock_ask, monkeypatch):
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+        mgr = ApprovalManager(mode="cli")
+        result = await mgr.request_approval("step1", "agent1", "Action", "output text")
+        assert result.edited_output == "output text"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 
 from agentforge.control.confidence import ConfidenceChecker
 
@@ -39,3 +40,23 @@ class TestConfidenceChecker:
         checker = ConfidenceChecker()
         score = checker.check("Some output text")
         assert 0.0 <= score <= 1.0
+
+    def test_long_output_boundary(self):
+        checker = ConfidenceChecker()
+        assert checker.check(" ".join(["word"] * 200)) == pytest.approx(0.7)
+        assert checker.check(" ".join(["word"] * 201)) == pytest.approx(0.8)
+        assert checker.check(" ".join(["word"] * 5000) + "  ") == pytest.approx(0.8)
+
+    def test_each_phrase_counts_once(self):
+        checker = ConfidenceChecker()
+        filler = " ".join(["word"] * 30)
+        once = checker.check(f"maybe {filler}")
+        repeated = checker.check(f"maybe maybe maybe {filler}")
+        assert once == repeated == pytest.approx(0.6)
+
+    def test_short_outputs(self):
+        checker = ConfidenceChecker()
+        assert checker.check("") == pytest.approx(0.6)
+        assert checker.check("42") == pytest.approx(0.6)
+        assert checker.check("maybe") == pytest.approx(0.5)
+        assert checker.check(" ".join(["a"] * 20)) == pytest.approx(0.7)
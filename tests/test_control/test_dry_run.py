@@ -32,3 +32,10 @@ class TestDryRunController:
         ctrl = DryRunController(enabled=True)
         result = ctrl.simulate_tool("calculator", {"expression": "2+2"})
         assert "2+2" in result.output
+
+    def test_simulate_tool_abbreviates_large_args(self):
+        ctrl = DryRunController(enabled=True)
+        result = ctrl.simulate_tool("file_write", {"path": "a.txt", "content": "x" * 100_000})
+        assert "path='a.txt'" in result.output
+        assert "..." in result.output
+        assert len(result.output) < 500
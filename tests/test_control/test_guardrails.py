@@ -0,0 +1,22 @@
+"""Tests for tool guardrails."""
+
+from __future__ import annotations
+
+from agentforge.control.guardrails import Guardrails
+
+
+class TestGuardrails:
+    def test_no_lists_allows_everything(self):
+        guard = Guardrails()
+        assert guard.is_tool_allowed("web_search") is True
+        assert guard.filter_tools(["a", "b"]) == ["a", "b"]
+
+    def test_blocked_wins_over_allowed(self):
+        guard = Guardrails(allowed_actions=["a", "b"], blocked_actions=["b"])
+        assert guard.is_tool_allowed("a") is True
+        assert guard.is_tool_allowed("b") is False
+        assert guard.is_tool_allowed("c") is False
+
+    def test_filter_tools_preserves_order(self):
+        guard = Guardrails(allowed_actions=["c", "a"], blocked_actions=["x"])
+        assert guard.filter_tools(["a", "x", "b", "c"]) == ["a", "c"]
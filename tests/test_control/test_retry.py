@@ -0,0 +1,135 @@
+"""Tests for retry handling."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agentforge.control.retry import RetryHandler
+
+
+class TestRetryHandler:
+    def test_delay_schedule(self):
+        handler = RetryHandler(max_retries=3, base_delay=0.5)
+        assert handler._delays == (0.5, 1.0, 2.0)
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("boom")
+            return "ok"
+
+        handler = RetryHandler(max_retries=3, base_delay=0)
+        assert await handler.execute_with_retry(flaky) == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_last_error(self):
+        async def always_fails():
+            raise TimeoutError("nope")
+
+        handler = RetryHandler(max_retries=2, base_delay=0)
+        with pytest.raises(TimeoutError, match="nope"):
+            await handler.execute_with_retry(always_fails)
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_fails_fast(self):
+        calls = []
+
+        async def buggy():
+            calls.append(1)
+            raise KeyError("missing")
+
+        handler = RetryHandler(max_retries=3, base_delay=0)
+        with pytest.raises(KeyError):
+            await handler.execute_with_retry(buggy)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_custom_retry_on(self):
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise ValueError("bad payload")
+            return "ok"
+
+        handler = RetryHandler(max_retries=1, base_delay=0, retry_on=(ValueError,))
+        assert await handler.execute_with_retry(flaky) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_not_retried(self):
+        calls = []
+
+        async def cancelled():
+            calls.append(1)
+            raise asyncio.CancelledError()
+
+        handler = RetryHandler(max_retries=3, base_delay=0)
+        with pytest.raises(asyncio.CancelledError):
+            await handler.execute_with_retry(cancelled)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_takes_first_success(self):
+        delays = [1.0, 0.0]
+        cancelled = []
+
+        async def slow_then_fast():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        handler = RetryHandler(max_retries=0, base_delay=0.01)
+        assert await handler.execute_with_hedge(slow_then_fast) == 0.0
+        await asyncio.sleep(0)
+        assert cancelled == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_hedge_fast_path_makes_one_call(self):
+        calls = []
+
+        async def quick():
+            calls.append(1)
+            return "ok"
+
+        handler = RetryHandler(max_retries=0, base_delay=0.5)
+        assert await handler.execute_with_hedge(quick) == "ok"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_falls_back_to_retry(self):
+        calls = []
+
+        async def fails_twice():
+            calls.append(1)
+            if len(calls) <= 2:
+                raise ConnectionError("down")
+            return "ok"
+
+        handler = RetryHandler(max_retries=1, base_delay=0)
+        assert await handler.execute_with_hedge(fails_twice, hedge_delay=0.01) == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_hedge_raises_non_retryable_error(self):
+        calls = []
+
+        async def buggy():
+            calls.append(1)
+            raise TypeError("bad call")
+
+        handler = RetryHandler(max_retries=3, base_delay=0)
+        with pytest.raises(TypeError):
+            await handler.execute_with_hedge(buggy, hedge_delay=0.01)
+        assert len(calls) == 1
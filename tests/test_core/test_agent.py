@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
 import pytest
 
-from agentforge.core.agent import Agent
+from agentforge.control.guardrails import Guardrails
+from agentforge.core.agent import Agent, _clip_tool_output, _trim_history
 from agentforge.core.result import AgentResult
-from agentforge.observe.tracer import Tracer
+from agentforge.llm.provider import LLMResponse
+from agentforge.observe.tracer import EventType, Tracer
 from agentforge.observe.events import EventBus
+from agentforge.tools.base import Tool
 
 
 class TestAgentCreation:
@@ -33,6 +39,13 @@ class TestAgentCreation:
         assert agent.name == "researcher"
         assert agent.role == "Researcher"
 
+    def test_from_config_uses_team_fallback_models(self):
+        config = {"role": "R", "goal": "G"}
+        team_config = {"llm": "openai/gpt-4o", "fallback_models": ["ollama/llama3"]}
+        assert Agent.from_config("a", config, team_config).fallback == ["ollama/llama3"]
+        config["fallback"] = ["anthropic/claude-3-haiku"]
+        assert Agent.from_config("a", config, team_config).fallback == ["anthropic/claude-3-haiku"]
+
 
 class TestAgentExecution:
     @pytest.mark.asyncio
@@ -71,7 +84,198 @@ class TestAgentSystemPrompt:
         prompt = agent._build_system_prompt()
         assert "Expert Writer" in prompt
 
+    def test_system_prompt_reflects_edits(self):
+        agent = Agent(name="w", role="Writer", goal="Write")
+        first = agent._build_system_prompt()
+        assert agent._build_system_prompt() == first
+        agent.goal = "Edit"
+        assert "Your goal: Edit" in agent._build_system_prompt()
+        assert "previous work:\nnote" in agent._build_system_prompt("note")
+
+    def test_formatted_tools_follow_tool_list(self):
+        tool = Tool(name="echo", description="Echo", parameters={}, handler=lambda: "")
+        agent = Agent(name="w", role="Writer", goal="Write", tools=[tool])
+        assert agent._format_tools_for_llm() is agent._format_tools_for_llm()
+        agent.tools = []
+        assert agent._format_tools_for_llm() == []
+
+    def test_tool_index_first_name_wins(self):
+        first = Tool(name="echo", description="A", parameters={}, handler=lambda: "")
+        second = Tool(name="echo", description="B", parameters={}, handler=lambda: "")
+        agent = Agent(name="w", role="Writer", goal="Write", tools=[first, second])
+        assert agent._tool_index() == {"echo": first}
+
+    def test_tool_permissions_follow_guardrails(self):
+        echo = Tool(name="echo", description="Echo", parameters={}, handler=lambda: "")
+        shell = Tool(name="shell", description="Shell", parameters={}, handler=lambda: "")
+        agent = Agent(
+            name="w", role="Writer", goal="Write", tools=[echo, shell],
+            control={"blocked_actions": ["shell"]},
+        )
+        assert agent._tool_permissions() == {"echo": True, "shell": False}
+        agent.guardrails = Guardrails(allowed_actions=["shell"])
+        assert agent._tool_permissions() == {"echo": False, "shell": True}
+
+    def test_confidence_checker_reused_until_threshold_changes(self):
+        agent = Agent(name="w", role="Writer", goal="Write")
+        assert agent._confidence_checker(0.0) is None
+        checker = agent._confidence_checker(0.5)
+        assert agent._confidence_checker(0.5) is checker
+        assert agent._confidence_checker(0.7).threshold == 0.7
+
     def test_system_prompt_includes_goal(self):
         agent = Agent(name="w", role="Writer", goal="Write amazing content")
         prompt = agent._build_system_prompt()
         assert "Write amazing content" in prompt
+
+
+class TestAgentToolCalls:
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently_in_order(self, mock_llm_router):
+        arrived = 0
+        both_running = asyncio.Event()
+
+        async def slow_echo(text: str) -> str:
+            # Only returns once the other echo call is in flight too
+            nonlocal arrived
+            arrived += 1
+            if arrived == 2:
+                both_running.set()
+            await asyncio.wait_for(both_running.wait(), timeout=5)
+            return text
+
+        tool = Tool(name="echo", description="Echo", parameters={}, handler=slow_echo)
+        calls = [
+            {"id": f"call_{i}", "function": {"name": name, "arguments": {"text": f"t{i}"}}}
+            for i, name in enumerate(["echo", "blocked", "echo"])
+        ]
+        responses = [
+            LLMResponse(content="", tool_calls=calls, model_used="m", input_tokens=1, output_tokens=1),
+            LLMResponse(content="done", tool_calls=[], model_used="m", input_tokens=1, output_tokens=1),
+        ]
+        seen_messages = []
+
+        async def complete(**kwargs):
+            seen_messages.append(list(kwargs["messages"]))
+            return responses.pop(0)
+
+        mock_llm_router.complete.side_effect = complete
+        agent = Agent(
+            name="test", role="Helper", goal="Help", tools=[tool],
+            control={"blocked_actions": ["blocked"]},
+        )
+        result = await agent.execute(
+            task="Echo", context={}, llm_router=mock_llm_router,
+            tracer=Tracer(), event_bus=EventBus(),
+        )
+        assert result.output == "done"
+        assistant = next(m for m in seen_messages[1] if m["role"] == "assistant")
+        assert json.loads(assistant["tool_calls"][0]["function"]["arguments"]) == {"text": "t0"}
+        tool_messages = [m for m in seen_messages[1] if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_0", "call_1", "call_2"]
+        assert tool_messages[0]["content"] == "t0"
+        assert "not allowed" in tool_messages[1]["content"]
+        assert tool_messages[2]["content"] == "t2"
+
+    @pytest.mark.asyncio
+    async def test_tool_concurrency_caps_in_flight_calls(self, mock_llm_router):
+        in_flight = peak = 0
+
+        async def tracked(text: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return text
+
+        tool = Tool(name="echo", description="Echo", parameters={}, handler=tracked)
+        calls = [
+            {"id": f"call_{i}", "function": {"name": "echo", "arguments": {"text": f"t{i}"}}}
+            for i in range(6)
+        ]
+        responses = [
+            LLMResponse(content="", tool_calls=calls, model_used="m", input_tokens=1, output_tokens=1),
+            LLMResponse(content="done", tool_calls=[], model_used="m", input_tokens=1, output_tokens=1),
+        ]
+
+        async def complete(**kwargs):
+            return responses.pop(0)
+
+        mock_llm_router.complete.side_effect = complete
+        agent = Agent(
+            name="test", role="Helper", goal="Help", tools=[tool],
+            control={"tool_concurrency": 2},
+        )
+        result = await agent.execute(
+            task="Echo", context={}, llm_router=mock_llm_router,
+            tracer=Tracer(), event_bus=EventBus(),
+        )
+        assert peak == 2
+        assert [tc.result for tc in result.tool_calls] == [f"t{i}" for i in range(6)]
+
+
+class TestAgentHistory:
+    def test_trim_keeps_head_and_newest_turns(self):
+        messages = [{"role": "system"}, {"role": "user"}] + [
+            {"role": "assistant", "n": i} for i in range(10)
+        ]
+        trimmed = _trim_history(messages, 5)
+        assert trimmed[:2] == messages[:2]
+        assert [m["n"] for m in trimmed[2:]] == [7, 8, 9]
+        assert _trim_history(messages[:4], 5) == messages[:4]
+
+    def test_trim_never_orphans_tool_results(self):
+        messages = [
+            {"role": "system"}, {"role": "user"},
+            {"role": "assistant", "tool_calls": ["a"]}, {"role": "tool"},
+            {"role": "assistant", "tool_calls": ["b", "c", "d"]},
+            {"role": "tool"}, {"role": "tool"}, {"role": "tool"},
+        ]
+        trimmed = _trim_history(messages, 4)
+        assert [m["role"] for m in trimmed] == ["system", "user", "assistant", "tool", "tool", "tool"]
+
+    def test_clip_tool_output(self):
+        assert _clip_tool_output("abcdef", None) == "abcdef"
+        assert _clip_tool_output("abcdef", 10) == "abcdef"
+        assert _clip_tool_output("abcdef", 3) == "abc...[truncated]"
+
+
+class TestAgentMemoryRecall:
+    @pytest.mark.asyncio
+    async def test_recall_overlaps_thinking_event(self, mock_llm_router):
+        recall_started = asyncio.Event()
+        thinking_seen = asyncio.Event()
+
+        class SlowMemory:
+            async def recall(self, agent_name, query, limit=10):
+                # Only returns once the AGENT_THINKING subscriber has run alongside
+                recall_started.set()
+                await asyncio.wait_for(thinking_seen.wait(), timeout=5)
+                return [{"content": "remembered fact"}]
+
+            async def store(self, *args, **kwargs):
+                pass
+
+        seen_messages = []
+        original = mock_llm_router.complete.side_effect
+
+        async def complete(**kwargs):
+            seen_messages.append(kwargs["messages"])
+            return await original(**kwargs)
+
+        mock_llm_router.complete.side_effect = complete
+        event_bus = EventBus()
+
+        async def slow_subscriber(event):
+            if event.event_type == EventType.AGENT_THINKING:
+                thinking_seen.set()
+                await asyncio.wait_for(recall_started.wait(), timeout=5)
+        event_bus.subscribe(slow_subscriber)
+
+        agent = Agent(name="test", role="Helper", goal="Help", memory=SlowMemory())
+        await agent.execute(
+            task="Hi", context={}, llm_router=mock_llm_router,
+            tracer=Tracer(), event_bus=event_bus,
+        )
+        assert "- remembered fact" in seen_messages[0][0]["content"]
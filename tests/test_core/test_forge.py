@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import yaml
 
+from agentforge.core import forge as forge_module
 from agentforge.core.forge import Forge
 from agentforge.config.loader import ConfigError
 
@@ -47,10 +50,32 @@ class TestForgeInit:
         forge = Forge.from_dict(sample_config)
         assert forge is not None
 
+    def test_summary_fields(self, sample_config):
+        forge = Forge.from_dict(sample_config)
+        assert forge.team_name == "Test Team"
+        assert forge.agent_names == ("assistant",)
+        assert forge.step_count == 1
+
     def test_from_yaml_nonexistent(self):
         with pytest.raises(ConfigError):
             Forge.from_yaml("/nonexistent.yaml")
 
+    def test_from_yaml_reuses_instance(self, minimal_yaml):
+        first = Forge.from_yaml(minimal_yaml, reuse=True)
+        first.event_bus.subscribe_sync(lambda e: None)
+        first.llm_router.total_cost = 1.5
+        second = Forge.from_yaml(minimal_yaml, reuse=True)
+        assert second is first
+        assert second.llm_router.total_cost == 0.0
+        assert second.event_bus._sync_subscribers == []
+
+    def test_from_yaml_builds_fresh_instance_by_default(self, minimal_yaml):
+        first = Forge.from_yaml(minimal_yaml)
+        first.event_bus.subscribe_sync(lambda e: None)
+        second = Forge.from_yaml(minimal_yaml)
+        assert second is not first
+        assert len(first.event_bus._sync_subscribers) == 1
+
 
 class TestForgeRun:
     @patch("agentforge.llm.router.litellm")
@@ -68,3 +93,44 @@ class TestForgeRun:
         forge = Forge.from_dict(sample_config)
         result = forge.run(task="Hello")
         assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_run_inside_event_loop_reuses_pool(self, sample_config, monkeypatch):
+        forge = Forge.from_dict(sample_config)
+        threads = []
+
+        async def fake_arun(task, **kwargs):
+            threads.append(threading.current_thread().name)
+            return task
+
+        monkeypatch.setattr(forge, "arun", fake_arun)
+        assert forge.run(task="one") == "one"
+        pool = forge_module._SYNC_POOL
+        assert forge.run(task="two") == "two"
+        assert forge_module._SYNC_POOL is pool
+        assert all(name.startswith("forge-sync") for name in threads)
+
+    @patch("agentforge.llm.router.litellm")
+    def test_dashboard_serves_run_tracer(self, mock_litellm, sample_config, monkeypatch):
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Test output"
+        mock_response.choices[0].message.tool_calls = None
+        mock_response.usage.prompt_tokens = 10
+        mock_response.usage.completion_tokens = 5
+        mock_response.model = "openai/gpt-4o-mini"
+        mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+        mock_litellm.completion_cost = MagicMock(return_value=0.001)
+
+        served = []
+        monkeypatch.setattr(
+            "agentforge.dashboard.app.create_dashboard_app",
+            lambda **kwargs: served.append(kwargs["tracer"]) or "app",
+        )
+        monkeypatch.setattr("uvicorn.run", lambda app, **kwargs: None)
+        monkeypatch.setattr("webbrowser.open", lambda url: None)
+        monkeypatch.setattr(forge_module.time, "sleep", lambda seconds: None)
+
+        forge = Forge.from_dict(sample_config)
+        forge.run(task="Hello", dashboard=True)
+        assert served == [forge.tracer]
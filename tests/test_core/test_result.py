@@ -0,0 +1,31 @@
+"""Tests for result data classes."""
+
+from __future__ import annotations
+
+import json
+
+from agentforge.core.result import CostSummary, ForgeResult, StepResult, TokenUsage
+
+
+def _result() -> ForgeResult:
+    return ForgeResult(
+        output="Done — ✓",
+        steps=[StepResult(step_id="s1", agent_name="a", output="x", tokens=TokenUsage(3, 4))],
+        cost=CostSummary(total_cost=0.01, total_tokens=TokenUsage(3, 4)),
+    )
+
+
+class TestForgeResult:
+    def test_to_dict(self):
+        data = _result().to_dict()
+        assert data["cost"]["total_tokens"] == {"input": 3, "output": 4, "total": 7}
+        assert data["steps"][0]["tokens"] == {"input": 3, "output": 4}
+
+    def test_to_json_round_trips(self):
+        result = _result()
+        assert json.loads(result.to_json()) == result.to_dict()
+        assert json.loads(result.to_json(indent=None)) == result.to_dict()
+        assert "\n    " in result.to_json(indent=4)
+
+    def test_slots(self):
+        assert not hasattr(TokenUsage(), "__dict__")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import fields
 
 from agentforge.core.step import Step, ParallelGroup
 
@@ -44,6 +45,24 @@ class TestStep:
         assert step.on_success == "next_step"
         assert step.on_fail == "error_step"
 
+    def test_format_suffix(self):
+        assert Step(id="s1", agent="a", task="t").format_suffix == ""
+        step = Step(id="s1", agent="a", task="t", output_format="json")
+        assert step.format_suffix == "\n\n[Respond in json format.]"
+        assert "format_suffix" not in [f.name for f in fields(Step) if f.compare]
+
+    def test_from_config(self):
+        step = Step.from_config({
+            "id": "s1", "agent": "a", "task": "t", "output_format": "json",
+            "timeout": None, "description": "not a Step field",
+        })
+        assert step == Step(id="s1", agent="a", task="t", output_format="json")
+        assert step.approval_gate is False
+
+    def test_slots(self):
+        assert not hasattr(Step(id="s1", agent="a", task="t"), "__dict__")
+        assert not hasattr(ParallelGroup(), "__dict__")
+
 
 class TestParallelGroup:
     def test_parallel_group(self):
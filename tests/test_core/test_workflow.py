@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import pytest
 
-from agentforge.core.workflow import Workflow
-from agentforge.core.step import Step
+from agentforge.core.workflow import Workflow, _parse_template
+from agentforge.core.step import ParallelGroup, Step
 from agentforge.core.agent import Agent
-from agentforge.observe.tracer import Tracer
+from agentforge.observe.tracer import EventType, Tracer
 from agentforge.observe.events import EventBus
 from agentforge.control.approval import ApprovalManager
 
@@ -39,6 +39,17 @@ class TestWorkflowCreation:
     def test_multi_step(self, multi_step_workflow):
         assert len(multi_step_workflow.steps) == 2
 
+    def test_step_map_built_at_construction(self, helper_agent):
+        steps = [
+            Step(id="first", agent="helper", task="A"),
+            ParallelGroup(steps=[
+                Step(id="p1", agent="helper", task="B"),
+                Step(id="p2", agent="helper", task="C"),
+            ]),
+        ]
+        workflow = Workflow(steps=steps, agents={"helper": helper_agent})
+        assert workflow.step_map == {"first": 0, "p1": 1, "p2": 1}
+
 
 class TestWorkflowExecution:
     @pytest.mark.asyncio
@@ -57,6 +68,25 @@ class TestWorkflowExecution:
         assert isinstance(results, list)
         assert len(results) >= 1
 
+    @pytest.mark.asyncio
+    async def test_step_events_shared_with_subscribers(self, simple_workflow, mock_llm_router):
+        tracer = Tracer()
+        event_bus = EventBus()
+        emitted = []
+        event_bus.subscribe_sync(emitted.append)
+
+        await simple_workflow.execute(
+            user_input="test",
+            tracer=tracer,
+            event_bus=event_bus,
+            llm_router=mock_llm_router,
+            approval_manager=ApprovalManager(mode="cli"),
+        )
+        step_types = (EventType.STEP_START, EventType.STEP_END)
+        traced = [e for e in tracer.events if e.event_type in step_types]
+        assert [e for e in emitted if e.event_type in step_types] == traced
+        assert "output_preview" in traced[1].data
+
 
 class TestResolveTemplate:
     def test_basic_interpolation(self, helper_agent):
@@ -74,6 +104,18 @@ class TestResolveTemplate:
         result = wf._resolve_template("{{a}} and {{b}}", {"a": "X", "b": "Y"})
         assert result == "X and Y"
 
+    def test_nested_path_and_partial_miss(self, helper_agent):
+        wf = Workflow(steps=[], agents={"helper": helper_agent})
+        context = {"research": {"output": "notes"}, "n": 3}
+        result = wf._resolve_template("{{ research.output }}/{{research.missing}}/{{n}}", context)
+        assert result == "notes/{{research.missing}}/3"
+
+    def test_parsed_template_is_cached(self):
+        tokens = _parse_template("Use {{a.b}} now")
+        assert tokens == ("Use ", ("{{a.b}}", ("a", "b")), " now")
+        assert _parse_template("Use {{a.b}} now") is tokens
+        assert _parse_template("") == ("",)
+
 
 class TestConditionEvaluation:
     def test_simple_condition(self, helper_agent):
@@ -83,3 +125,14 @@ class TestConditionEvaluation:
     def test_false_condition(self, helper_agent):
         wf = Workflow(steps=[], agents={"helper": helper_agent})
         assert wf._evaluate_condition("1 > 2", {}) is False
+
+    def test_numeric_comparison(self, helper_agent):
+        wf = Workflow(steps=[], agents={"helper": helper_agent})
+        assert wf._evaluate_condition("3 >= 2.5", {}) is True
+        assert wf._evaluate_condition("2 >= 2.5", {}) is False
+
+    def test_empty_check_reads_current_context(self, helper_agent):
+        wf = Workflow(steps=[], agents={"helper": helper_agent})
+        assert wf._evaluate_condition("draft empty", {"draft": {"output": ""}}) is True
+        assert wf._evaluate_condition("draft empty", {"draft": {"output": "text"}}) is False
+        assert wf._evaluate_condition("draft not empty", {"draft": "text"}) is True
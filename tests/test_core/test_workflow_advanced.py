@@ -7,6 +7,7 @@ import asyncio
 import pytest
 
 from agentforge.core.agent import Agent
+from agentforge.core.result import AgentResult
 from agentforge.core.step import ParallelGroup, Step
 from agentforge.core.workflow import Workflow
 from agentforge.observe.events import EventBus
@@ -58,6 +59,82 @@ class TestParallelExecution:
         )
         assert len(results) == 3
 
+    @pytest.mark.asyncio
+    async def test_max_concurrency_limits_parallel_steps(self, agents, mock_llm_router):
+        running = {"now": 0, "peak": 0}
+        original = mock_llm_router.complete.side_effect
+
+        async def tracked_complete(**kwargs):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return await original(**kwargs)
+
+        mock_llm_router.complete.side_effect = tracked_complete
+        group = ParallelGroup(steps=[
+            Step(id=f"p{i}", agent="alpha", task=f"Task {i}") for i in range(4)
+        ])
+        wf = Workflow(steps=[group], agents=agents, control_config={"max_concurrency": 2})
+        results = await wf.execute(
+            user_input="go",
+            tracer=Tracer(),
+            event_bus=EventBus(),
+            llm_router=mock_llm_router,
+            approval_manager=ApprovalManager(mode="cli"),
+        )
+        assert len(results) == 4
+        assert running["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_parallel_step_keeps_siblings(self, agents, mock_llm_router, monkeypatch):
+        async def broken_execute(**kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(agents["beta"], "execute", broken_execute)
+        group = ParallelGroup(steps=[
+            Step(id="p1", agent="alpha", task="A"),
+            Step(id="p2", agent="beta", task="B"),
+        ])
+        wf = Workflow(steps=[group], agents=agents)
+        results = await wf.execute(
+            user_input="go",
+            tracer=Tracer(),
+            event_bus=EventBus(),
+            llm_router=mock_llm_router,
+            approval_manager=ApprovalManager(mode="cli"),
+        )
+        by_id = {r.step_id: r for r in results}
+        assert by_id["p1"].success
+        assert not by_id["p2"].success
+        assert "boom" in by_id["p2"].error
+
+    @pytest.mark.asyncio
+    async def test_single_step_group_runs_inline(self, agents, mock_llm_router, monkeypatch):
+        async def broken_execute(**kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(agents["beta"], "execute", broken_execute)
+        wf = Workflow(
+            steps=[
+                ParallelGroup(steps=[Step(id="p1", agent="alpha", task="A")]),
+                ParallelGroup(steps=[Step(id="p2", agent="beta", task="B")]),
+            ],
+            agents=agents,
+        )
+        tracer = Tracer()
+        results = await wf.execute(
+            user_input="go",
+            tracer=tracer,
+            event_bus=EventBus(),
+            llm_router=mock_llm_router,
+            approval_manager=ApprovalManager(mode="cli"),
+        )
+        assert [r.step_id for r in results] == ["p1", "p2"]
+        assert results[0].success
+        assert not results[1].success and "boom" in results[1].error
+        assert any(e.data.get("parallel") for e in tracer.events)
+
 
 class TestConditionalExecution:
     @pytest.mark.asyncio
@@ -109,6 +186,27 @@ class TestBranching:
         assert "s3" in ids
         assert "s2" not in ids
 
+    @pytest.mark.asyncio
+    async def test_retry_and_loop_limits(self, agents, mock_llm_router, monkeypatch):
+        async def failing_execute(**kwargs):
+            return AgentResult(output="", success=False, error="nope")
+
+        monkeypatch.setattr(agents["beta"], "execute", failing_execute)
+        steps = [
+            Step(id="flaky", agent="beta", task="Try", retry_on_fail=2),
+            Step(id="loop", agent="alpha", task="Again", next="loop"),
+        ]
+        wf = Workflow(steps=steps, agents=agents, control_config={"max_retries": 1})
+        results = await wf.execute(
+            user_input="go",
+            tracer=Tracer(),
+            event_bus=EventBus(),
+            llm_router=mock_llm_router,
+            approval_manager=ApprovalManager(mode="cli"),
+        )
+        # Each step runs at most max_retries + 1 times
+        assert [r.step_id for r in results] == ["flaky", "flaky", "loop", "loop"]
+
 
 class TestTimeoutEnforcement:
     @pytest.mark.asyncio
@@ -0,0 +1,200 @@
+"""Tests for the LLM response cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentforge.llm.cache import (
+    InMemoryCache,
+    SemanticCache,
+    SQLiteCache,
+    create_cache,
+    create_semantic_cache,
+    make_cache_key,
+    semantic_cache_key,
+)
+from agentforge.llm.router import LLMRouter
+
+
+def _mock_response(content: str = "Hello!"):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.choices[0].message.tool_calls = None
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = 5
+    return response
+
+
+def _semantic_cache(path) -> SemanticCache:
+    cache = SemanticCache(path=str(path), threshold=0.97)
+    # Letter counts stand in for a real embedding model
+    cache._embed_fn = lambda texts: [
+        [float(t.lower().count(c)) for c in "abcdefghijklmnopqrstuvwxyz"] for t in texts
+    ]
+    return cache
+
+
+class TestCacheKey:
+    def test_key_is_deterministic(self):
+        msgs = [{"role": "user", "content": "Hi"}]
+        assert make_cache_key("m", msgs, None, 0.0, 100) == make_cache_key("m", msgs, None, 0.0, 100)
+
+    def test_key_depends_on_model(self):
+        msgs = [{"role": "user", "content": "Hi"}]
+        assert make_cache_key("a", msgs, None, 0.0, 100) != make_cache_key("b", msgs, None, 0.0, 100)
+
+
+class TestInMemoryCache:
+    @pytest.mark.asyncio
+    async def test_set_and_get(self):
+        cache = InMemoryCache()
+        await cache.set("k", {"content": "v"})
+        assert await cache.get("k") == {"content": "v"}
+
+    @pytest.mark.asyncio
+    async def test_hits_are_independent_copies(self):
+        cache = InMemoryCache()
+        value = {"tool_calls": [{"function": {"arguments": {"q": "x"}}}]}
+        await cache.set("k", value)
+        value["tool_calls"][0]["function"]["arguments"]["q"] = "changed"
+        hit = await cache.get("k")
+        hit["tool_calls"].clear()
+        assert (await cache.get("k"))["tool_calls"][0]["function"]["arguments"] == {"q": "x"}
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", {})
+        await cache.set("b", {})
+        await cache.get("a")
+        await cache.set("c", {})
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_missing(self):
+        cache = InMemoryCache()
+        await cache.set("k", {}, ttl=-1)
+        assert await cache.get("k") is None
+
+
+class TestSQLiteCache:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        cache = SQLiteCache(db_path=str(tmp_path / "cache.db"))
+        await cache.set("k", {"content": "v"})
+        assert await cache.get("k") == {"content": "v"}
+        await cache.delete("k")
+        assert await cache.get("k") is None
+        cache.close()
+
+
+class TestSemanticCache:
+    @pytest.mark.asyncio
+    async def test_near_duplicate_hit(self, tmp_path):
+        cache = _semantic_cache(tmp_path)
+        await cache.set("scope", "Hello there!", {"content": "hi"})
+        assert await cache.get("scope", "hello there") == {"content": "hi"}
+        assert await cache.get("scope", "Goodbye") is None
+        assert await cache.get("other", "Hello there!") is None
+
+    @pytest.mark.asyncio
+    async def test_ephemeral_caches_are_isolated(self):
+        first, second = SemanticCache(), SemanticCache()
+        for cache in (first, second):
+            cache._embed_fn = lambda texts: [[1.0, float(len(t))] for t in texts]
+        await first.set("scope", "Hello", {"content": "hi"})
+        assert await first.get("scope", "Hello") == {"content": "hi"}
+        assert second._collection is not None
+        assert await second.get("scope", "Hello") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_missing(self, tmp_path):
+        cache = _semantic_cache(tmp_path)
+        await cache.set("scope", "Hello", {"content": "hi"}, ttl=-1)
+        assert await cache.get("scope", "Hello") is None
+
+    def test_key_scopes_on_earlier_messages(self):
+        system = {"role": "system", "content": "You are helpful"}
+        scope, text = semantic_cache_key("m", [system, {"role": "user", "content": "Hi"}], None, 0, 10)
+        other, _ = semantic_cache_key("m", [{"role": "user", "content": "Hi"}], None, 0, 10)
+        assert text == "Hi"
+        assert scope != other
+
+
+class TestCreateCache:
+    def test_disabled(self):
+        assert create_cache({"enabled": False}) is None
+
+    def test_memory_default(self):
+        assert isinstance(create_cache({}), InMemoryCache)
+
+    def test_semantic_cache_is_opt_in(self):
+        assert create_semantic_cache({}) is None
+        assert create_semantic_cache({"enabled": False, "similarity_threshold": 0.9}) is None
+
+
+class TestRouterCaching:
+    @pytest.mark.asyncio
+    @patch("agentforge.llm.router.acompletion")
+    @patch("agentforge.llm.router.litellm")
+    async def test_deterministic_call_cached(self, mock_litellm, mock_acompletion):
+        mock_acompletion.return_value = _mock_response()
+        mock_litellm.completion_cost = MagicMock(return_value=0.001)
+        router = LLMRouter(cache=InMemoryCache())
+        msgs = [{"role": "user", "content": "Hi"}]
+
+        first = await router.complete(messages=msgs, temperature=0)
+        second = await router.complete(messages=msgs, temperature=0)
+
+        assert mock_acompletion.call_count == 1
+        assert not first.cached
+        assert second.cached
+        assert second.content == "Hello!"
+        assert second.tokens_saved == 15
+        assert second.cost == 0.0
+
+    @pytest.mark.asyncio
+    @patch("agentforge.llm.router.acompletion")
+    @patch("agentforge.llm.router.litellm")
+    async def test_nonzero_temperature_not_cached(self, mock_litellm, mock_acompletion):
+        mock_acompletion.return_value = _mock_response()
+        mock_litellm.completion_cost = MagicMock(return_value=0.001)
+        router = LLMRouter(cache=InMemoryCache())
+        msgs = [{"role": "user", "content": "Hi"}]
+
+        await router.complete(messages=msgs, temperature=0.7)
+        await router.complete(messages=msgs, temperature=0.7)
+        assert mock_acompletion.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("agentforge.llm.router.acompletion")
+    @patch("agentforge.llm.router.litellm")
+    async def test_explicit_opt_in(self, mock_litellm, mock_acompletion):
+        mock_acompletion.return_value = _mock_response()
+        mock_litellm.completion_cost = MagicMock(return_value=0.001)
+        router = LLMRouter(cache=InMemoryCache())
+        msgs = [{"role": "user", "content": "Hi"}]
+
+        await router.complete(messages=msgs, temperature=0.7, cache=True)
+        await router.complete(messages=msgs, temperature=0.7, cache=True)
+        assert mock_acompletion.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("agentforge.llm.router.acompletion")
+    @patch("agentforge.llm.router.litellm")
+    async def test_semantic_cache_serves_near_duplicates(self, mock_litellm, mock_acompletion, tmp_path):
+        mock_acompletion.return_value = _mock_response()
+        mock_litellm.completion_cost = MagicMock(return_value=0.001)
+        router = LLMRouter(semantic_cache=_semantic_cache(tmp_path))
+
+        await router.complete(messages=[{"role": "user", "content": "Hello there!"}], temperature=0)
+        hit = await router.complete(messages=[{"role": "user", "content": "hello there"}], temperature=0)
+        await router.complete(messages=[{"role": "user", "content": "hello there"}], temperature=0, cache=False)
+
+        assert hit.cached
+        assert hit.content == "Hello!"
+        assert mock_acompletion.call_count == 2
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, patch
 
-from agentforge.llm.router import LLMRouter
+from agentforge.llm.router import LLMRouter, _backoff_delay, _is_transient, _with_prompt_cache
 
 
 class TestLLMRouterInit:
@@ -68,6 +70,84 @@ class TestLLMRouterComplete:
         assert summary["total_cost"] > 0
         assert summary["call_count"] >= 1
 
+    @pytest.mark.asyncio
+    @patch("agentforge.llm.router.acompletion")
+    @patch("agentforge.llm.router.litellm")
+    async def test_tool_call_arguments_keep_encoded_form(self, mock_litellm, mock_acompletion):
+        def tool_call(call_id, arguments):
+            tc = MagicMock()
+            tc.id = call_id
+            tc.function.name = "search"
+            tc.function.arguments = arguments
+            return tc
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = ""
+        mock_response.choices[0].message.tool_calls = [
+            tool_call("a", '{"q": "x"}'),
+            tool_call("b", {"q": "y"}),
+            tool_call("c", "not json"),
+        ]
+        mock_response.usage.prompt_tokens = 1
+        mock_response.usage.completion_tokens = 1
+        mock_acompletion.return_value = mock_response
+        mock_litellm.completion_cost = MagicMock(return_value=0.0)
+
+        router = LLMRouter(default_model="openai/gpt-4o-mini")
+        result = await router.complete(messages=[{"role": "user", "content": "Hi"}])
+        functions = [tc["function"] for tc in result.tool_calls]
+        assert [f["arguments"] for f in functions] == [{"q": "x"}, {"q": "y"}, {}]
+        assert [f["arguments_json"] for f in functions] == ['{"q": "x"}', '{"q":"y"}', "{}"]
+
+    @pytest.mark.asyncio
+    @patch("agentforge.llm.router.acompletion")
+    @patch("agentforge.llm.router.litellm")
+    async def test_race_returns_first_success_and_cancels_rest(self, mock_litellm, mock_acompletion):
+        cancelled = []
+
+        async def acompletion(**kwargs):
+            if kwargs["model"] == "slow":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(kwargs["model"])
+                    raise
+            if kwargs["model"] == "broken":
+                raise ValueError("bad request")
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = kwargs["model"]
+            response.choices[0].message.tool_calls = None
+            return response
+
+        mock_acompletion.side_effect = acompletion
+        mock_litellm.completion_cost = MagicMock(return_value=0.0)
+
+        router = LLMRouter()
+        result = await router.complete(
+            messages=[{"role": "user", "content": "Hi"}],
+            model="slow", fallback=["broken", "fast"], race=True,
+        )
+        await asyncio.sleep(0)
+        assert result.model_used == "fast"
+        assert cancelled == ["slow"]
+        assert [r.model for r in router.call_log if r.success] == ["fast"]
+
+
+class TestRetryBackoff:
+    def test_delay_is_jittered_and_capped(self):
+        for attempt in range(8):
+            base = min(8.0, 0.25 * 2**attempt)
+            assert base * 0.5 <= _backoff_delay(attempt) <= base * 1.5
+
+    def test_transient_errors(self):
+        import litellm
+
+        assert _is_transient(Exception("429 Too Many Requests"))
+        assert _is_transient(litellm.ServiceUnavailableError("down", llm_provider="openai", model="m"))
+        assert not _is_transient(ValueError("bad request"))
+
 
 class TestLLMRouterCostSummary:
     def test_empty_summary(self):
@@ -75,3 +155,20 @@ class TestLLMRouterCostSummary:
         summary = router.get_cost_summary()
         assert summary["total_cost"] == 0
         assert summary["call_count"] == 0
+
+
+class TestPromptCacheMarker:
+    def test_anthropic_system_prompt_marked(self):
+        messages = [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "Hi"},
+        ]
+        marked = _with_prompt_cache("anthropic/claude-sonnet-4", messages)
+        assert marked[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert marked[0]["content"][0]["text"] == "You are helpful."
+        assert marked[1] is messages[1]
+        assert messages[0]["content"] == "You are helpful."
+
+    def test_other_providers_untouched(self):
+        messages = [{"role": "system", "content": "You are helpful."}]
+        assert _with_prompt_cache("openai/gpt-4o-mini", messages) is messages
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from agentforge.memory.long_term import LongTermMemory
@@ -51,3 +53,64 @@ class TestLongTermMemory:
         mem = LongTermMemory(db_path=temp_db)
         memory_id = await mem.store("agent1", "Very important fact", importance=0.9)
         assert memory_id is not None
+
+    def test_connection_uses_wal(self, temp_db):
+        mem = LongTermMemory(db_path=temp_db)
+        assert mem._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert mem._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        mem.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_recalls_use_reader_pool(self, temp_db):
+        mem = LongTermMemory(db_path=temp_db)
+        await mem.store("agent1", "Fact about Python")
+        results = await asyncio.gather(*(mem.recall("agent1", "Python") for _ in range(4)))
+        assert all(len(r) == 1 for r in results)
+        assert 1 <= mem._readers.qsize() <= 4
+        mem.close()
+
+    @pytest.mark.asyncio
+    async def test_in_memory_database_reads_writer(self):
+        mem = LongTermMemory(db_path=":memory:")
+        assert mem._chroma_collection is None
+        await mem.store("agent1", "Fact about Python")
+        assert len(await mem.recall("agent1", "Python")) == 1
+        assert mem._readers.empty()
+
+    def test_query_embeddings_are_cached(self, temp_db, monkeypatch):
+        monkeypatch.setenv("AGENTFORGE_EMBED_CACHE_MAXSIZE", "2")
+        mem = LongTermMemory(db_path=temp_db)
+        calls = []
+
+        def embed(texts):
+            calls.append(texts[0])
+            return [[float(len(texts[0]))]]
+
+        mem._embed_fn = embed
+        assert mem._query_embedding("a") == [1.0]
+        assert mem._query_embedding("a") == [1.0]
+        mem._query_embedding("bb")
+        mem._query_embedding("ccc")
+        mem._query_embedding("a")
+        assert calls == ["a", "bb", "ccc", "a"]
+        mem._embedding_cache_ttl = 0
+        mem._query_embedding("a")
+        assert calls[-1] == "a" and len(calls) == 5
+        mem.close()
+
+    @pytest.mark.asyncio
+    async def test_recall_marks_results_accessed(self, temp_db):
+        mem = LongTermMemory(db_path=temp_db)
+        mem._chroma_collection = None
+        await mem.store("agent1", "Python is great")
+        await mem.store("agent1", "Rust is fast")
+        await mem.recall("agent1", "Python", limit=2)
+        await mem.recall("agent1", "Python", limit=1)
+        rows = mem._conn.execute("SELECT content, access_count FROM memories ORDER BY content").fetchall()
+        assert [tuple(r) for r in rows] == [("Python is great", 2), ("Rust is fast", 1)]
+        mem.close()
+
+    def test_embedding_cache_size_must_be_positive(self, temp_db, monkeypatch):
+        monkeypatch.setenv("AGENTFORGE_EMBED_CACHE_MAXSIZE", "0")
+        with pytest.raises(ValueError, match="AGENTFORGE_EMBED_CACHE_MAXSIZE"):
+            LongTermMemory(db_path=temp_db)
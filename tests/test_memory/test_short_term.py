@@ -43,3 +43,13 @@ class TestShortTermMemory:
         await mem.store("agent", "JavaScript is used for web development")
         results = await mem.recall("agent", "Python programming")
         assert any("Python" in r.get("content", "") for r in results)
+
+    @pytest.mark.asyncio
+    async def test_recall_ranks_by_matches_then_insertion(self):
+        mem = ShortTermMemory()
+        await mem.store("agent", "alpha")
+        await mem.store("agent", "beta")
+        await mem.store("agent", "Alpha Beta")
+        await mem.store("agent", "gamma", importance=0.9)
+        results = await mem.recall("agent", "alpha beta", limit=4)
+        assert [r["content"] for r in results] == ["Alpha Beta", "alpha", "beta", "gamma"]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
 import pytest
 
-from agentforge.observe.tracer import Tracer, TraceEvent, EventType
+from agentforge.observe.tracer import Tracer, TraceEvent, EventType, dumps_json
 from agentforge.observe.export import export_trace_json, export_trace_dict
 from agentforge.observe.cost_report import generate_cost_dict
 
@@ -40,6 +43,23 @@ class TestTraceEvent:
         assert isinstance(d, dict)
         assert d["event_type"] == "step_start"
 
+    def test_slots(self):
+        event = TraceEvent(event_type=EventType.STEP_START)
+        assert not hasattr(event, "__dict__")
+
+    def test_derived_totals_follow_edits(self):
+        event = TraceEvent(
+            event_type=EventType.STEP_END,
+            tokens={"input": 30, "output": 12},
+            cost=0.0021,
+        )
+        assert event.tokens_total == 42
+        assert event.cost_display == "$0.0021"
+        event.tokens = {"input": 1}
+        event.cost = 0.5
+        assert event.tokens_total == 1
+        assert event.cost_display == "$0.5000"
+
 
 class TestTracer:
     def test_init(self):
@@ -73,12 +93,30 @@ class TestTracer:
         elapsed = tracer.elapsed()
         assert elapsed >= 0
 
+    def test_record_many(self, tracer):
+        events = [
+            TraceEvent(event_type=EventType.TOOL_CALL, agent_name="a"),
+            TraceEvent(event_type=EventType.TOOL_RESULT, agent_name="a"),
+        ]
+        tracer.record_many(events)
+        assert tracer.events == events
+
     def test_get_cost_breakdown(self, tracer):
         breakdown = tracer.get_cost_breakdown()
         assert isinstance(breakdown, dict)
         assert "total_cost" in breakdown
 
 
+class TestDumpsJson:
+    def test_round_trip(self):
+        payload = {"a": 1, "b": [1.5, "x"], "c": None}
+        assert json.loads(dumps_json(payload)) == payload
+        assert json.loads(dumps_json(payload, pretty=True)) == payload
+
+    def test_unknown_types_stringified(self):
+        assert json.loads(dumps_json({"obj": object}))["obj"] == str(object)
+
+
 class TestEventBus:
     def test_subscribe_sync(self, event_bus):
         received = []
@@ -104,6 +142,43 @@ class TestEventBus:
         await event_bus.emit(event)
         assert len(received) == 1
 
+    @pytest.mark.asyncio
+    async def test_emit_many_preserves_order(self, event_bus):
+        received = []
+        event_bus.subscribe_sync(lambda event: received.append(("sync", event.step_id)))
+
+        async def handler(event):
+            received.append(("async", event.step_id))
+        event_bus.subscribe(handler)
+        await event_bus.emit_many([
+            TraceEvent(event_type=EventType.STEP_START, step_id="s1"),
+            TraceEvent(event_type=EventType.STEP_START, step_id="s2"),
+        ])
+        assert received == [("sync", "s1"), ("async", "s1"), ("sync", "s2"), ("async", "s2")]
+
+    @pytest.mark.asyncio
+    async def test_async_subscribers_run_concurrently(self, event_bus):
+        received = []
+        arrived = 0
+        all_arrived = asyncio.Event()
+
+        async def waiting(event):
+            # Only completes if the other subscriber is running at the same time
+            nonlocal arrived
+            arrived += 1
+            if arrived == 2:
+                all_arrived.set()
+            await asyncio.wait_for(all_arrived.wait(), timeout=5)
+            received.append(event.step_id)
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        for handler in (waiting, waiting, failing):
+            event_bus.subscribe(handler)
+        await event_bus.emit(TraceEvent(event_type=EventType.STEP_START, step_id="s1"))
+        assert received == ["s1", "s1"]
+
     def test_clear(self, event_bus):
         event_bus.subscribe_sync(lambda e: None)
         event_bus.clear()
@@ -125,6 +200,12 @@ class TestExport:
         content = out.read_text()
         assert "s1" in content
 
+    def test_export_json_writes_utf8(self, tracer, tmp_path):
+        tracer.record(TraceEvent(event_type=EventType.AGENT_RESPONSE, data={"output": "café ✓"}))
+        out = tmp_path / "trace.json"
+        tracer.export_json(str(out))
+        assert "café ✓" in out.read_text(encoding="utf-8")
+
 
 class TestCostReport:
     def test_generate_cost_dict(self, tracer):